@@ -0,0 +1,50 @@
+"""In-process caching helpers."""
+
+import time
+from typing import Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Process-local cache whose entries expire after a fixed TTL.
+
+    Meant for small reference data that is read on hot paths and changes
+    rarely. Entries are evicted oldest-first once ``maxsize`` is reached.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: Dict[K, Tuple[float, V]] = {}
+
+    def get(self, key: K) -> Optional[V]:
+        """Get a cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Cache a value for the configured TTL."""
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: K) -> None:
+        """Invalidate a single key."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Invalidate all keys."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -31,32 +31,39 @@ async def init_database() -> None:
         echo=settings.debug,
         pool_size=20,
         max_overflow=30,
-        pool_pre_ping=True,
+        pool_pre_ping=settings.db_pool_pre_ping,
         pool_recycle=3600,
+        # Repositories run the same handful of statements on every request;
+        # keep them prepared on each pooled connection rather than
+        # re-parsing and re-planning them
+        connect_args={
+            "prepared_statement_cache_size": settings.db_statement_cache_size,
+            "statement_cache_size": settings.db_statement_cache_size,
+        },
     )
     
     async_session_factory = async_sessionmaker(
         engine,
         class_=AsyncSession,
         expire_on_commit=False,
+        autoflush=False,  # Repositories flush explicitly
     )
     
     logger.info("Database initialized", database_url=settings.database_url)
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    """Get database session dependency."""
+    """Get database session dependency.
+    
+    The whole request runs in one transaction on one connection: committed
+    when the request handler returns, rolled back if it raises.
+    """
     if async_session_factory is None:
         raise RuntimeError("Database not initialized")
     
     async with async_session_factory() as session:
-        try:
+        async with session.begin():
             yield session
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
 
 
 async def close_database() -> None:
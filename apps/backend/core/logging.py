@@ -1,14 +1,36 @@
 """Structured logging configuration."""
 
+import functools
 import logging
+import queue
 import sys
-from typing import Any, Dict
+import time
+import uuid
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Awaitable, Callable, Dict, Generator, Optional, TypeVar
 
 import structlog
 from structlog.stdlib import LoggerFactory
 
 from .config import get_settings
 
+# Writes queued log records to stdout off the request path
+_log_listener: Optional[QueueListener] = None
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+def _stringify_uuids(logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Render UUID values as plain strings.
+    
+    Callers pass IDs as-is so the conversion only happens for events that are
+    actually emitted, not for ones filtered out by level.
+    """
+    for key, value in event_dict.items():
+        if isinstance(value, uuid.UUID):
+            event_dict[key] = str(value)
+    return event_dict
+
 
 def setup_logging() -> None:
     """Configure structured logging."""
@@ -22,6 +44,7 @@ def setup_logging() -> None:
             structlog.processors.StackInfoRenderer(),
             structlog.dev.set_exc_info,
             structlog.processors.TimeStamper(fmt="ISO"),
+            _stringify_uuids,
             structlog.dev.ConsoleRenderer() if settings.is_development 
             else structlog.processors.JSONRenderer(),
         ],
@@ -32,19 +55,99 @@ def setup_logging() -> None:
         cache_logger_on_first_use=True,
     )
     
-    # Configure standard library logging
+    # Configure standard library logging. Callers only enqueue records; a
+    # listener thread formats them and does the blocking stdout writes.
+    global _log_listener
+    
+    if _log_listener:
+        _log_listener.stop()
+    
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+    _log_listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    _log_listener.start()
+    
+    # force: replace handlers already on the root logger (uvicorn, pytest,
+    # or an earlier setup_logging call) instead of silently keeping them
     logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
+        handlers=[queue_handler],
         level=getattr(logging, settings.log_level.upper()),
+        force=True,
     )
 
 
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the listener thread."""
+    global _log_listener
+    
+    if _log_listener:
+        _log_listener.stop()
+        _log_listener = None
+
+
 def get_logger(name: str) -> structlog.BoundLogger:
     """Get a structured logger instance."""
     return structlog.get_logger(name)
 
 
+class _TimedAwait:
+    """Drive a coroutine, timing how long it spends suspended on awaits."""
+    
+    def __init__(self, coro: Any) -> None:
+        self.coro = coro
+        self.awaited = 0.0
+        self.suspensions = 0
+    
+    def __await__(self) -> Generator[Any, Any, Any]:
+        value: Any = None
+        error: Optional[BaseException] = None
+        while True:
+            try:
+                yielded = self.coro.throw(error) if error else self.coro.send(value)
+            except StopIteration as stop:
+                return stop.value
+            suspended_at = time.perf_counter()
+            try:
+                value, error = (yield yielded), None
+            except BaseException as exc:
+                value, error = None, exc
+            self.awaited += time.perf_counter() - suspended_at
+            self.suspensions += 1
+
+
+def profile_await(func: F) -> F:
+    """Log wall time of a coroutine method, split into awaiting and running.
+    
+    cProfile charges time spent waiting on I/O to whatever happens to be
+    running, so this measures it directly. Only active when PROFILE_AWAITS is
+    set; otherwise the method is returned undecorated.
+    """
+    if not get_settings().profile_awaits:
+        return func
+    
+    logger = get_logger("profile")
+    
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        timed = _TimedAwait(func(*args, **kwargs))
+        start = time.perf_counter()
+        try:
+            return await timed
+        finally:
+            elapsed = time.perf_counter() - start
+            logger.info(
+                "Await profile",
+                function=func.__qualname__,
+                elapsed_ms=round(elapsed * 1000, 3),
+                awaited_ms=round(timed.awaited * 1000, 3),
+                running_ms=round((elapsed - timed.awaited) * 1000, 3),
+                suspensions=timed.suspensions,
+            )
+    
+    return wrapper  # type: ignore[return-value]
+
+
 class LoggingMiddleware:
     """Request logging middleware."""
     
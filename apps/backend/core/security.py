@@ -17,6 +17,9 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # JWT token scheme
 security = HTTPBearer()
 
+# Token roles allowed through get_current_vendor
+_VENDOR_ROLES = frozenset({"vendor", "admin"})
+
 
 class TokenData(BaseModel):
     """Token payload data."""
@@ -136,7 +139,7 @@ async def get_current_user(token: str = Depends(security)) -> TokenData:
 
 async def get_current_vendor(current_user: TokenData = Depends(get_current_user)) -> TokenData:
     """Require vendor role."""
-    if current_user.role not in ["vendor", "admin"]:
+    if current_user.role not in _VENDOR_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Vendor access required",
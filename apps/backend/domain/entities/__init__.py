@@ -2,7 +2,7 @@
 
 from .analytics import AnalyticsSummary, EventBatch, EventLog
 from .base import BaseEntity, TimestampedEntity
-from .deal import Deal, DealWithVenue
+from .deal import DAY_BITS, Deal, DealWithVenue
 from .favorite import Favorite, FavoriteWithVenue
 from .flag import Flag, FlagWithDetails
 from .media import Media, MediaUploadRequest, MediaUploadResponse
@@ -25,6 +25,7 @@ __all__ = [
     # Deal
     "Deal",
     "DealWithVenue",
+    "DAY_BITS",
     # Media
     "Media",
     "MediaUploadRequest",
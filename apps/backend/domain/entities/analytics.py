@@ -10,6 +10,27 @@ from ..enums import EventType
 from .base import TimestampedEntity
 
 
+class _ReadOnlyDict(dict):
+    """Dict that refuses mutation and is never copied."""
+    
+    def _read_only(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Shared empty metadata is read-only")
+    
+    __setitem__ = __delitem__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+    
+    def __copy__(self) -> "_ReadOnlyDict":
+        return self
+    
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "_ReadOnlyDict":
+        return self
+
+
+# Default metadata shared by every event that has none, instead of a new dict
+# per event. Assign a fresh dict to EventLog.meta to add metadata.
+EMPTY_META: Dict[str, Any] = _ReadOnlyDict()
+
+
 class EventLog(TimestampedEntity):
     """Analytics event log."""
     
@@ -20,7 +41,7 @@ class EventLog(TimestampedEntity):
     session_id: Optional[str] = Field(None, max_length=100)
     
     # Event metadata
-    meta: Dict[str, Any] = Field(default_factory=dict)
+    meta: Dict[str, Any] = EMPTY_META
     
     # Device/location info
     user_agent: Optional[str] = Field(None, max_length=500)
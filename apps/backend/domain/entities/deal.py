@@ -2,13 +2,27 @@
 
 import uuid
 from datetime import datetime, time
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
 from ..enums import DayOfWeek, DealCategory, PriceDisplayMode
 from .base import BaseEntity
 
+# Bit for each day in Deal.days_mask (bit 0 = Monday ... bit 6 = Sunday)
+DAY_BITS: Dict[DayOfWeek, int] = {
+    day: 1 << i
+    for i, day in enumerate([
+        DayOfWeek.MONDAY,
+        DayOfWeek.TUESDAY,
+        DayOfWeek.WEDNESDAY,
+        DayOfWeek.THURSDAY,
+        DayOfWeek.FRIDAY,
+        DayOfWeek.SATURDAY,
+        DayOfWeek.SUNDAY,
+    ])
+}
+
 
 class Deal(BaseEntity):
     """Deal entity."""
@@ -24,7 +38,7 @@ class Deal(BaseEntity):
     price_display_mode: PriceDisplayMode = PriceDisplayMode.SHOW
     
     # Timing
-    days_mask: int = 0  # Bitmask for days (1=Monday, 2=Tuesday, etc.)
+    days_mask: int = Field(0, ge=0, le=0b1111111)  # Bitmask for days (1=Monday, 2=Tuesday, etc.)
     start_time: Optional[time] = None
     end_time: Optional[time] = None
     
@@ -40,6 +54,11 @@ class Deal(BaseEntity):
     is_featured: bool = False
     requires_age_verification: bool = False
     
+    # Content tags, computed from title/description when the deal is written
+    # (None on rows written before tagging existed)
+    is_alcohol: Optional[bool] = None
+    is_happy_hour_marketing: Optional[bool] = None
+    
     # Verification
     last_verified_at: Optional[datetime] = None
     verified_by: Optional[uuid.UUID] = None
@@ -47,42 +66,20 @@ class Deal(BaseEntity):
     @property
     def active_days(self) -> List[DayOfWeek]:
         """Get list of active days."""
-        days = []
-        day_mapping = [
-            DayOfWeek.MONDAY,
-            DayOfWeek.TUESDAY,
-            DayOfWeek.WEDNESDAY,
-            DayOfWeek.THURSDAY,
-            DayOfWeek.FRIDAY,
-            DayOfWeek.SATURDAY,
-            DayOfWeek.SUNDAY,
-        ]
-        
-        for i, day in enumerate(day_mapping):
-            if self.days_mask & (1 << i):
-                days.append(day)
-        
-        return days
+        return [day for day, bit in DAY_BITS.items() if self.days_mask & bit]
     
     def set_active_days(self, days: List[DayOfWeek]) -> None:
         """Set active days using bitmask."""
-        day_mapping = {
-            DayOfWeek.MONDAY: 0,
-            DayOfWeek.TUESDAY: 1,
-            DayOfWeek.WEDNESDAY: 2,
-            DayOfWeek.THURSDAY: 3,
-            DayOfWeek.FRIDAY: 4,
-            DayOfWeek.SATURDAY: 5,
-            DayOfWeek.SUNDAY: 6,
-        }
-        
         self.days_mask = 0
         for day in days:
-            if day in day_mapping:
-                self.days_mask |= (1 << day_mapping[day])
+            self.days_mask |= DAY_BITS.get(day, 0)
         
         self.updated_at = datetime.utcnow()
     
+    def applies_on(self, days_bits: int) -> bool:
+        """Check if the deal runs on any of the given days (a DAY_BITS mask)."""
+        return (self.days_mask & days_bits) != 0
+    
     @property
     def savings_amount(self) -> Optional[float]:
         """Calculate savings amount."""
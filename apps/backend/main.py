@@ -22,8 +22,9 @@ from core.exceptions import (
     http_exception_handler,
     validation_exception_handler,
 )
-from core.logging import LoggingMiddleware, setup_logging
+from core.logging import LoggingMiddleware, setup_logging, shutdown_logging
 from core.redis import close_redis, init_redis
+from services.event_sink import close_event_sink, init_event_sink
 
 
 @asynccontextmanager
@@ -32,6 +33,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Startup
     setup_logging()
     await init_database()
+    init_event_sink()
     
     # Try to initialize Redis, but don't fail if it's not available
     try:
@@ -43,11 +45,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     yield
     
     # Shutdown
+    await close_event_sink()
     await close_database()
     try:
         await close_redis()
     except Exception:
         pass  # Ignore Redis close errors
+    shutdown_logging()
 
 
 def create_app() -> FastAPI:
@@ -3,7 +3,7 @@
 import uuid
 from typing import Any, Dict, Generic, List, Optional, Type, TypeVar
 
-from sqlalchemy import and_, desc, func, or_, select
+from sqlalchemy import and_, desc, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -12,13 +12,22 @@ from domain.entities.base import BaseEntity
 T = TypeVar("T", bound=BaseEntity)
 ModelType = TypeVar("ModelType")
 
+# Current UTC time, computed by the database, for the naive UTC DateTime columns
+SQL_UTC_NOW = func.timezone("UTC", func.now())
+
 
 class BaseRepository(Generic[T, ModelType]):
     """Base repository with common CRUD operations."""
     
-    def __init__(self, db: AsyncSession, model: Type[ModelType]):
+    def __init__(self, db: AsyncSession, model: Type[ModelType], entity: Type[T]):
         self.db = db
         self.model = model
+        self.entity = entity
+        # Table column names, resolved once so conversions don't introspect
+        # the table per row.
+        self._columns = frozenset(model.__table__.columns.keys())
+        # Entity fields backed by a column, in field order
+        self._read_fields = tuple(f for f in entity.model_fields if f in self._columns)
     
     async def create(self, entity: T) -> T:
         """Create a new entity."""
@@ -43,14 +52,31 @@ class BaseRepository(Generic[T, ModelType]):
             raise ValueError(f"Entity with id {entity.id} not found")
         
         # Update fields
-        for field, value in entity.model_dump(exclude_unset=True).items():
-            if hasattr(db_obj, field):
-                setattr(db_obj, field, value)
+        for field, value in self._model_values(entity, exclude_unset=True).items():
+            setattr(db_obj, field, value)
         
         await self.db.flush()
         await self.db.refresh(db_obj)
         return self._model_to_entity(db_obj)
     
+    async def patch(self, entity_id: uuid.UUID, **values: Any) -> Optional[T]:
+        """Set columns on one entity with a single UPDATE ... RETURNING.
+        
+        Returns None if no entity has the given ID.
+        """
+        # Let the column's onupdate stamp updated_at rather than writing back
+        # the copy loaded with the entity
+        values.pop("updated_at", None)
+        result = await self.db.execute(
+            update(self.model)
+            .where(self.model.id == entity_id)
+            .values(**values)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        db_obj = result.scalar_one_or_none()
+        return self._model_to_entity(db_obj) if db_obj else None
+    
     async def delete(self, entity_id: uuid.UUID) -> bool:
         """Delete entity."""
         db_obj = await self.db.get(self.model, entity_id)
@@ -96,12 +122,18 @@ class BaseRepository(Generic[T, ModelType]):
         db_objects = result.scalars().all()
         return [self._model_to_entity(obj) for obj in db_objects]
     
+    def _model_values(self, entity: T, exclude_unset: bool = False) -> Dict[str, Any]:
+        """Get the column values of a domain entity."""
+        return entity.model_dump(include=self._columns, exclude_unset=exclude_unset)
+    
     def _entity_to_model(self, entity: T) -> ModelType:
         """Convert domain entity to SQLAlchemy model."""
-        # This should be implemented by subclasses
-        raise NotImplementedError
+        return self.model(**self._model_values(entity))
     
     def _model_to_entity(self, model: ModelType) -> T:
         """Convert SQLAlchemy model to domain entity."""
-        # This should be implemented by subclasses
-        raise NotImplementedError
+        # Rows come from our own schema and were validated on the way in, so
+        # build the entity directly instead of re-validating every field.
+        return self.entity.model_construct(
+            **{field: getattr(model, field) for field in self._read_fields}
+        )
@@ -1,14 +1,15 @@
 """Deal repository implementation."""
 
 import uuid
+from datetime import datetime
 from typing import List, Optional
 
 from geoalchemy2 import WKTElement
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, func, literal_column, or_, select, union_all, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from domain.entities import Deal
-from domain.enums import DealCategory
+from domain.entities import DAY_BITS, Deal
+from domain.enums import DayOfWeek, DealCategory
 from repositories.base import BaseRepository
 from repositories.models import Deal as DealModel, Venue as VenueModel
 
@@ -17,7 +18,54 @@ class DealRepositoryImpl(BaseRepository[Deal, DealModel]):
     """Deal repository implementation."""
     
     def __init__(self, db: AsyncSession):
-        super().__init__(db, DealModel)
+        super().__init__(db, DealModel, Deal)
+    
+    async def update(self, deal: Deal) -> Optional[Deal]:
+        """Update deal in one round trip. Returns None if it doesn't exist."""
+        values = self._model_values(deal, exclude_unset=True)
+        values.pop("id", None)
+        return await self.patch(deal.id, **values)
+    
+    async def feature(self, deal_id: uuid.UUID) -> Optional[Deal]:
+        """Mark deal as featured."""
+        return await self.patch(deal_id, is_featured=True)
+    
+    async def unfeature(self, deal_id: uuid.UUID) -> Optional[Deal]:
+        """Unmark deal as featured."""
+        return await self.patch(deal_id, is_featured=False)
+    
+    async def verify(self, deal_id: uuid.UUID, verified_by: uuid.UUID) -> Optional[Deal]:
+        """Mark deal as verified."""
+        return await self.patch(
+            deal_id, last_verified_at=datetime.utcnow(), verified_by=verified_by
+        )
+    
+    async def redeem(self, deal_id: uuid.UUID) -> Optional[Deal]:
+        """Use one redemption if the deal is still available.
+        
+        The availability check and increment happen in one statement, so
+        concurrent redemptions can't overshoot max_redemptions. Returns None
+        if the deal doesn't exist or isn't available.
+        """
+        result = await self.db.execute(
+            update(DealModel)
+            .where(
+                and_(
+                    DealModel.id == deal_id,
+                    DealModel.is_active == True,
+                    or_(
+                        DealModel.max_redemptions.is_(None),
+                        DealModel.max_redemptions == 0,
+                        DealModel.redemptions_used < DealModel.max_redemptions,
+                    ),
+                )
+            )
+            .values(redemptions_used=DealModel.redemptions_used + 1)
+            .returning(DealModel)
+            .execution_options(populate_existing=True)
+        )
+        db_obj = result.scalar_one_or_none()
+        return self._model_to_entity(db_obj) if db_obj else None
     
     async def list_by_venue(self, venue_id: uuid.UUID, active_only: bool = True) -> List[Deal]:
         """List deals by venue."""
@@ -40,7 +88,8 @@ class DealRepositoryImpl(BaseRepository[Deal, DealModel]):
         radius_km: float = 10.0,
         category: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        day: Optional[str] = None
     ) -> List[Deal]:
         """List active deals nearby using PostGIS."""
         # Create point from coordinates
@@ -59,6 +108,11 @@ class DealRepositoryImpl(BaseRepository[Deal, DealModel]):
         if category:
             conditions.append(DealModel.category == DealCategory(category))
         
+        if day:
+            # Literals (not binds) so the matching idx_deals_dayN partial index applies
+            bit = literal_column(str(DAY_BITS[DayOfWeek(day)]))
+            conditions.append(DealModel.days_mask.op("&")(bit) != literal_column("0"))
+        
         result = await self.db.execute(
             select(DealModel)
             .join(VenueModel, DealModel.venue_id == VenueModel.id)
@@ -82,58 +136,51 @@ class DealRepositoryImpl(BaseRepository[Deal, DealModel]):
         db_objects = result.scalars().all()
         return [self._model_to_entity(obj) for obj in db_objects]
     
-    def _entity_to_model(self, entity: Deal) -> DealModel:
-        """Convert Deal entity to DealModel."""
-        return DealModel(
-            id=entity.id,
-            venue_id=entity.venue_id,
-            title=entity.title,
-            description=entity.description,
-            category=entity.category,
-            original_price=entity.original_price,
-            deal_price=entity.deal_price,
-            price_display_mode=entity.price_display_mode,
-            days_mask=entity.days_mask,
-            start_time=entity.start_time,
-            end_time=entity.end_time,
-            restrictions=entity.restrictions,
-            terms=entity.terms,
-            min_purchase=entity.min_purchase,
-            max_redemptions=entity.max_redemptions,
-            redemptions_used=entity.redemptions_used,
-            is_active=entity.is_active,
-            is_featured=entity.is_featured,
-            requires_age_verification=entity.requires_age_verification,
-            last_verified_at=entity.last_verified_at,
-            verified_by=entity.verified_by,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
+    async def list_trending(
+        self,
+        lat: float,
+        lng: float,
+        radius_km: float = 10.0,
+        limit: int = 20
+    ) -> List[Deal]:
+        """List featured deals, then active deals nearby, in one query.
+        
+        Each half gets limit // 2 rows; a deal can appear in both halves.
+        """
+        point = WKTElement(f"POINT({lng} {lat})", srid=4326)
+        
+        featured = (
+            select(
+                DealModel.id,
+                literal_column("0").label("part"),
+                func.row_number().over(order_by=DealModel.created_at.desc()).label("pos"),
+            )
+            .where(and_(DealModel.is_active == True, DealModel.is_featured == True))
+            .order_by(DealModel.created_at.desc())
+            .limit(limit // 2)
         )
-    
-    def _model_to_entity(self, model: DealModel) -> Deal:
-        """Convert DealModel to Deal entity."""
-        return Deal(
-            id=model.id,
-            venue_id=model.venue_id,
-            title=model.title,
-            description=model.description,
-            category=model.category,
-            original_price=model.original_price,
-            deal_price=model.deal_price,
-            price_display_mode=model.price_display_mode,
-            days_mask=model.days_mask,
-            start_time=model.start_time,
-            end_time=model.end_time,
-            restrictions=model.restrictions,
-            terms=model.terms,
-            min_purchase=model.min_purchase,
-            max_redemptions=model.max_redemptions,
-            redemptions_used=model.redemptions_used,
-            is_active=model.is_active,
-            is_featured=model.is_featured,
-            requires_age_verification=model.requires_age_verification,
-            last_verified_at=model.last_verified_at,
-            verified_by=model.verified_by,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
+        nearby = (
+            select(
+                DealModel.id,
+                literal_column("1").label("part"),
+                func.row_number().over(order_by=func.ST_Distance(VenueModel.geo, point)).label("pos"),
+            )
+            .join(VenueModel, DealModel.venue_id == VenueModel.id)
+            .where(
+                and_(
+                    DealModel.is_active == True,
+                    VenueModel.geo.isnot(None),
+                    func.ST_DWithin(VenueModel.geo, point, radius_km * 1000),
+                )
+            )
+            .order_by(func.ST_Distance(VenueModel.geo, point))
+            .limit(limit // 2)
+        )
+        ranked = union_all(featured, nearby).subquery()
+        
+        result = await self.db.execute(
+            select(DealModel)
+            .join(ranked, DealModel.id == ranked.c.id)
+            .order_by(ranked.c.part, ranked.c.pos)
         )
+        return [self._model_to_entity(obj) for obj in result.scalars()]
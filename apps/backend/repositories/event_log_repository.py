@@ -2,56 +2,226 @@
 
 import json
 import uuid
-from typing import Any, Dict, List
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import (
+    DateTime,
+    String,
+    and_,
+    cast,
+    column,
+    desc,
+    func,
+    literal,
+    literal_column,
+    select,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, UUID, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.entities import EventLog
 from repositories.base import BaseRepository
-from repositories.models import EventLog as EventLogModel
+from repositories.models import EventLog as EventLogModel, EventLogHourlyRollup
+
+# Column order for COPY rows built by EventLogRepositoryImpl._copy_record.
+# id is left to its server default.
+_COPY_COLUMNS = [
+    "user_id",
+    "type",
+    "target_type",
+    "target_id",
+    "session_id",
+    "ip_address",
+    "user_agent",
+    "meta",
+    "created_at",
+]
+
+# Batches at least this large go through COPY; smaller ones through a single
+# INSERT ... SELECT FROM unnest(...), which is cheaper to set up
+COPY_MIN_ROWS = 200
+# Rows per COPY or INSERT, bounding the size of each round trip
+BATCH_CHUNK_ROWS = 5000
+
+# Array element types for the unnest insert; type and meta are sent as text
+# and cast to the column type
+_UNNEST_TYPES = {
+    name: String if name in ("type", "meta") else EventLogModel.__table__.c[name].type
+    for name in _COPY_COLUMNS
+}
 
 
 class EventLogRepositoryImpl(BaseRepository[EventLog, EventLogModel]):
     """Event log repository implementation."""
     
     def __init__(self, db: AsyncSession):
-        super().__init__(db, EventLogModel)
+        super().__init__(db, EventLogModel, EventLog)
+    
+    @asynccontextmanager
+    async def relaxed_durability(self) -> AsyncIterator[None]:
+        """Commit the current transaction without waiting for the WAL flush.
+        
+        Telemetry only: if the server crashes, the last few hundred
+        milliseconds of commits may be lost (but the database stays
+        consistent). The setting applies to the whole transaction, so don't
+        use it where the same transaction writes anything that must survive.
+        """
+        await self.db.execute(text("SET LOCAL synchronous_commit TO OFF"))
+        yield
+    
+    async def create(self, event: EventLog) -> EventLog:
+        """Create event log."""
+        created = await super().create(event)
+        await self._increment_rollups([event])
+        return created
     
     async def create_batch(self, events: List[EventLog]) -> List[EventLog]:
-        """Create multiple event logs."""
-        db_objects = [self._entity_to_model(event) for event in events]
-        self.db.add_all(db_objects)
-        await self.db.flush()
+        """Create multiple event logs, bypassing the ORM.
         
-        # Refresh all objects to get IDs
-        for obj in db_objects:
-            await self.db.refresh(obj)
+        Rows get their IDs from the database and other defaults client-side;
+        the events are returned as given rather than read back.
+        """
+        for start in range(0, len(events), BATCH_CHUNK_ROWS):
+            chunk = events[start:start + BATCH_CHUNK_ROWS]
+            if len(chunk) >= COPY_MIN_ROWS:
+                await self._copy_rows(chunk)
+            else:
+                await self._insert_rows(chunk)
         
-        return [self._model_to_entity(obj) for obj in db_objects]
+        await self._increment_rollups(events)
+        return events
+    
+    async def _copy_rows(self, events: List[EventLog]) -> None:
+        """Write events with COPY."""
+        conn = await self.db.connection()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            EventLogModel.__tablename__,
+            records=[self._copy_record(event) for event in events],
+            columns=_COPY_COLUMNS,
+        )
+    
+    async def _insert_rows(self, events: List[EventLog]) -> None:
+        """Write events with one INSERT over per-column arrays."""
+        columns = zip(*(self._copy_record(event) for event in events))
+        batch = func.unnest(
+            *[
+                literal(list(values), ARRAY(_UNNEST_TYPES[name]))
+                for name, values in zip(_COPY_COLUMNS, columns)
+            ]
+        ).table_valued(
+            *[column(name, _UNNEST_TYPES[name]) for name in _COPY_COLUMNS]
+        ).render_derived(name="batch")
+        
+        table_columns = EventLogModel.__table__.c
+        rows = select(
+            *[
+                cast(batch.c[name], table_columns[name].type)
+                if name in ("type", "meta") else batch.c[name]
+                for name in _COPY_COLUMNS
+            ]
+        )
+        await self.db.execute(insert(EventLogModel).from_select(_COPY_COLUMNS, rows))
+    
+    async def list_top_targets(
+        self,
+        target_type: str,
+        since: datetime,
+        limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """List targets of a type with the most events since a time, from the hourly rollup."""
+        total = func.sum(EventLogHourlyRollup.count).label("event_count")
+        result = await self.db.execute(
+            select(EventLogHourlyRollup.target_id, total)
+            .where(
+                and_(
+                    EventLogHourlyRollup.target_type == target_type,
+                    EventLogHourlyRollup.hour_bucket >= since,
+                )
+            )
+            .group_by(EventLogHourlyRollup.target_id)
+            .order_by(desc(total))
+            .limit(limit)
+        )
+        return [
+            {"target_id": row.target_id, "event_count": row.event_count}
+            for row in result
+        ]
+    
+    async def _increment_rollups(self, events: List[EventLog]) -> None:
+        """Add events to the hourly rollup counts.
+        
+        The batch is sent as one array per column and grouped by Postgres,
+        so the statement has the same four parameters whatever the batch size.
+        """
+        if not events:
+            return
+        
+        batch = func.unnest(
+            literal([e.target_type for e in events], ARRAY(String)),
+            literal([e.target_id for e in events], ARRAY(UUID(as_uuid=True))),
+            literal([e.created_at for e in events], ARRAY(DateTime)),
+            literal([e.type.name for e in events], ARRAY(String)),
+        ).table_valued(
+            column("target_type", String),
+            column("target_id", UUID(as_uuid=True)),
+            column("created_at", DateTime),
+            column("type", String),
+        ).render_derived(name="batch")
+        
+        keys = (
+            batch.c.target_type,
+            batch.c.target_id,
+            func.date_trunc(literal_column("'hour'"), batch.c.created_at),
+            cast(batch.c.type, EventLogHourlyRollup.__table__.c.type.type),
+        )
+        counts = (
+            select(*keys, func.count())
+            .select_from(batch)
+            .group_by(*keys)
+            # Ordered so concurrent flushes lock rollup rows in the same order
+            .order_by(*keys)
+        )
+        
+        stmt = insert(EventLogHourlyRollup).from_select(
+            ["target_type", "target_id", "hour_bucket", "type", "count"], counts
+        )
+        await self.db.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["target_type", "target_id", "hour_bucket", "type"],
+                set_={"count": EventLogHourlyRollup.count + stmt.excluded["count"]},
+            )
+        )
     
     async def get_analytics_summary(
         self,
         target_id: uuid.UUID,
         target_type: str,
         start_date: str,
-        end_date: str
+        end_date: str,
+        meta_filter: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
-        """Get analytics summary for target."""
+        """Get analytics summary for target, optionally only events whose meta contains meta_filter."""
+        conditions = [
+            EventLogModel.target_id == target_id,
+            EventLogModel.target_type == target_type,
+            EventLogModel.created_at >= start_date,
+            EventLogModel.created_at <= end_date,
+        ]
+        if meta_filter:
+            # jsonb @> so idx_event_meta_gin can serve it
+            conditions.append(EventLogModel.meta.contains(meta_filter))
+        
         # Get event counts by type
         result = await self.db.execute(
             select(
                 EventLogModel.type,
                 func.count(EventLogModel.id).label("count")
             )
-            .where(
-                and_(
-                    EventLogModel.target_id == target_id,
-                    EventLogModel.target_type == target_type,
-                    EventLogModel.created_at >= start_date,
-                    EventLogModel.created_at <= end_date
-                )
-            )
+            .where(and_(*conditions))
             .group_by(EventLogModel.type)
         )
         
@@ -88,34 +258,17 @@ class EventLogRepositoryImpl(BaseRepository[EventLog, EventLogModel]):
             "period_end": end_date,
         }
     
-    def _entity_to_model(self, entity: EventLog) -> EventLogModel:
-        """Convert EventLog entity to EventLogModel."""
-        return EventLogModel(
-            id=entity.id,
-            user_id=entity.user_id,
-            type=entity.type,
-            target_type=entity.target_type,
-            target_id=entity.target_id,
-            session_id=entity.session_id,
-            ip_address=entity.ip_address,
-            user_agent=entity.user_agent,
-            meta=json.dumps(entity.meta) if entity.meta else None,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
-        )
-    
-    def _model_to_entity(self, model: EventLogModel) -> EventLog:
-        """Convert EventLogModel to EventLog entity."""
-        return EventLog(
-            id=model.id,
-            user_id=model.user_id,
-            type=model.type,
-            target_type=model.target_type,
-            target_id=model.target_id,
-            session_id=model.session_id,
-            ip_address=model.ip_address,
-            user_agent=model.user_agent,
-            meta=json.loads(model.meta) if model.meta else {},
-            created_at=model.created_at,
-            updated_at=model.updated_at,
+    @staticmethod
+    def _copy_record(event: EventLog) -> Tuple[Any, ...]:
+        """Convert EventLog entity to a COPY row matching _COPY_COLUMNS."""
+        return (
+            event.user_id,
+            event.type.name,  # PG enum labels are the member names
+            event.target_type,
+            event.target_id,
+            event.session_id,
+            event.ip_address,
+            event.user_agent,
+            json.dumps(event.meta),
+            event.created_at,
         )
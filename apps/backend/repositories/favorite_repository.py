@@ -15,7 +15,7 @@ class FavoriteRepositoryImpl(BaseRepository[Favorite, FavoriteModel]):
     """Favorite repository implementation."""
     
     def __init__(self, db: AsyncSession):
-        super().__init__(db, FavoriteModel)
+        super().__init__(db, FavoriteModel, Favorite)
     
     async def get_by_user_and_venue(self, user_id: uuid.UUID, venue_id: uuid.UUID) -> Optional[Favorite]:
         """Get favorite by user and venue."""
@@ -41,23 +41,3 @@ class FavoriteRepositoryImpl(BaseRepository[Favorite, FavoriteModel]):
         )
         db_objects = result.scalars().all()
         return [self._model_to_entity(obj) for obj in db_objects]
-    
-    def _entity_to_model(self, entity: Favorite) -> FavoriteModel:
-        """Convert Favorite entity to FavoriteModel."""
-        return FavoriteModel(
-            id=entity.id,
-            user_id=entity.user_id,
-            venue_id=entity.venue_id,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
-        )
-    
-    def _model_to_entity(self, model: FavoriteModel) -> Favorite:
-        """Convert FavoriteModel to Favorite entity."""
-        return Favorite(
-            id=model.id,
-            user_id=model.user_id,
-            venue_id=model.venue_id,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
-        )
@@ -3,7 +3,8 @@
 import uuid
 from typing import List, Optional
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, select, text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from domain.entities import Flag
@@ -16,7 +17,24 @@ class FlagRepositoryImpl(BaseRepository[Flag, FlagModel]):
     """Flag repository implementation."""
     
     def __init__(self, db: AsyncSession):
-        super().__init__(db, FlagModel)
+        super().__init__(db, FlagModel, Flag)
+    
+    async def create_if_absent(self, flag: Flag) -> Optional[Flag]:
+        """Create a flag unless the user already has a pending one on the target.
+        
+        Returns None on conflict with uq_flags_pending_user_target.
+        """
+        result = await self.db.execute(
+            insert(FlagModel)
+            .values(**self._model_values(flag))
+            .on_conflict_do_nothing(
+                index_elements=["user_id", "target_type", "target_id"],
+                index_where=text("status = 'PENDING'"),
+            )
+            .returning(FlagModel)
+        )
+        db_obj = result.scalar_one_or_none()
+        return self._model_to_entity(db_obj) if db_obj else None
     
     async def list_pending(self, limit: int = 50, offset: int = 0) -> List[Flag]:
         """List pending flags."""
@@ -29,35 +47,3 @@ class FlagRepositoryImpl(BaseRepository[Flag, FlagModel]):
         )
         db_objects = result.scalars().all()
         return [self._model_to_entity(obj) for obj in db_objects]
-    
-    def _entity_to_model(self, entity: Flag) -> FlagModel:
-        """Convert Flag entity to FlagModel."""
-        return FlagModel(
-            id=entity.id,
-            target_type=entity.target_type,
-            target_id=entity.target_id,
-            reason=entity.reason,
-            description=entity.description,
-            user_id=entity.user_id,
-            status=entity.status,
-            resolved_by=entity.resolved_by,
-            resolved_at=entity.resolved_at,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
-        )
-    
-    def _model_to_entity(self, model: FlagModel) -> Flag:
-        """Convert FlagModel to Flag entity."""
-        return Flag(
-            id=model.id,
-            target_type=model.target_type,
-            target_id=model.target_id,
-            reason=model.reason,
-            description=model.description,
-            user_id=model.user_id,
-            status=model.status,
-            resolved_by=model.resolved_by,
-            resolved_at=model.resolved_at,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
-        )
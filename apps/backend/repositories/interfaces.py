@@ -2,7 +2,8 @@
 
 import uuid
 from abc import ABC, abstractmethod
-from typing import List, Optional, Protocol
+from datetime import datetime
+from typing import Any, AsyncContextManager, Dict, Iterable, List, Optional, Protocol
 
 from domain.entities import (
     Deal,
@@ -15,6 +16,7 @@ from domain.entities import (
     Venue,
     VenueWithDetails,
 )
+from domain.enums import VenueStatus
 
 
 class UserRepository(Protocol):
@@ -24,6 +26,10 @@ class UserRepository(Protocol):
         """Create a new user."""
         ...
     
+    async def create_if_absent(self, user: User) -> Optional[User]:
+        """Create a user unless the email is taken. Returns None if it is."""
+        ...
+    
     async def get_by_id(self, user_id: uuid.UUID) -> Optional[User]:
         """Get user by ID."""
         ...
@@ -32,8 +38,23 @@ class UserRepository(Protocol):
         """Get user by email."""
         ...
     
-    async def update(self, user: User) -> User:
-        """Update user."""
+    async def get_by_ids(self, user_ids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, User]:
+        """Get users by IDs, keyed by ID."""
+        ...
+    
+    async def update(self, user: User) -> Optional[User]:
+        """Update user. Returns None if it doesn't exist.
+        
+        Raises BusinessRuleError (DUPLICATE_EMAIL) if the new email is taken.
+        """
+        ...
+    
+    async def patch(self, user_id: uuid.UUID, **values: Any) -> Optional[User]:
+        """Set columns on a user. Returns None if it doesn't exist."""
+        ...
+    
+    async def touch_last_login(self, user_id: uuid.UUID) -> Optional[User]:
+        """Stamp the user's last login time. Returns None if it doesn't exist."""
         ...
     
     async def delete(self, user_id: uuid.UUID) -> bool:
@@ -52,10 +73,30 @@ class VenueRepository(Protocol):
         """Create a new venue."""
         ...
     
+    async def create_if_absent(self, venue: Venue) -> Optional[Venue]:
+        """Create a venue unless its vendor has one with the same name (ignoring case)."""
+        ...
+    
     async def get_by_id(self, venue_id: uuid.UUID) -> Optional[VenueWithDetails]:
         """Get venue by ID with details."""
         ...
     
+    async def set_status(self, venue_id: uuid.UUID, status: VenueStatus) -> Optional[Venue]:
+        """Set a venue's status. Returns None if it doesn't exist."""
+        ...
+    
+    async def verify(self, venue_id: uuid.UUID) -> Optional[Venue]:
+        """Mark venue as verified. Returns None if it doesn't exist."""
+        ...
+    
+    async def get_by_id_summary(self, venue_id: uuid.UUID) -> Optional[Venue]:
+        """Get venue by ID without hours or deal counts."""
+        ...
+    
+    async def get_by_ids(self, venue_ids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, Venue]:
+        """Get venues (without details) by IDs, keyed by ID."""
+        ...
+    
     async def get_by_slug(self, slug: str) -> Optional[VenueWithDetails]:
         """Get venue by slug."""
         ...
@@ -108,8 +149,24 @@ class DealRepository(Protocol):
         """Get deal by ID."""
         ...
     
-    async def update(self, deal: Deal) -> Deal:
-        """Update deal."""
+    async def update(self, deal: Deal) -> Optional[Deal]:
+        """Update deal. Returns None if it doesn't exist."""
+        ...
+    
+    async def feature(self, deal_id: uuid.UUID) -> Optional[Deal]:
+        """Mark deal as featured."""
+        ...
+    
+    async def unfeature(self, deal_id: uuid.UUID) -> Optional[Deal]:
+        """Unmark deal as featured."""
+        ...
+    
+    async def verify(self, deal_id: uuid.UUID, verified_by: uuid.UUID) -> Optional[Deal]:
+        """Mark deal as verified."""
+        ...
+    
+    async def redeem(self, deal_id: uuid.UUID) -> Optional[Deal]:
+        """Use one redemption if the deal is still available."""
         ...
     
     async def delete(self, deal_id: uuid.UUID) -> bool:
@@ -127,14 +184,25 @@ class DealRepository(Protocol):
         radius_km: float = 10.0,
         category: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        day: Optional[str] = None
     ) -> List[Deal]:
-        """List active deals nearby."""
+        """List active deals nearby, optionally only those running on a given day."""
         ...
     
     async def list_featured(self, limit: int = 20) -> List[Deal]:
         """List featured deals."""
         ...
+    
+    async def list_trending(
+        self,
+        lat: float,
+        lng: float,
+        radius_km: float = 10.0,
+        limit: int = 20
+    ) -> List[Deal]:
+        """List featured deals, then active deals nearby."""
+        ...
 
 
 class MediaRepository(Protocol):
@@ -188,6 +256,10 @@ class FlagRepository(Protocol):
         """Create a flag."""
         ...
     
+    async def create_if_absent(self, flag: Flag) -> Optional[Flag]:
+        """Create a flag unless the user already has a pending one on the target."""
+        ...
+    
     async def get_by_id(self, flag_id: uuid.UUID) -> Optional[Flag]:
         """Get flag by ID."""
         ...
@@ -228,12 +300,26 @@ class EventLogRepository(Protocol):
         """Create multiple event logs."""
         ...
     
+    def relaxed_durability(self) -> AsyncContextManager[None]:
+        """Commit the current transaction without waiting for the WAL flush."""
+        ...
+    
+    async def list_top_targets(
+        self,
+        target_type: str,
+        since: datetime,
+        limit: int = 10
+    ) -> List[dict]:
+        """List targets of a type with the most events since a time."""
+        ...
+    
     async def get_analytics_summary(
         self,
         target_id: uuid.UUID,
         target_type: str,
         start_date: str,
-        end_date: str
+        end_date: str,
+        meta_filter: Optional[dict] = None
     ) -> dict:
         """Get analytics summary for target."""
         ...
@@ -6,19 +6,24 @@ from typing import List, Optional
 
 from geoalchemy2 import Geometry
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
+    SmallInteger,
     String,
     Text,
     Time,
     UniqueConstraint,
+    func,
+    text,
 )
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -36,10 +41,27 @@ from domain.enums import (
     UserRole,
     VenueStatus,
 )
+from repositories.types import IntEnumType
 
 Base = declarative_base()
 
 
+def _deal_day_indexes() -> List[Index]:
+    """Partial index per weekday bit of Deal.days_mask, for active deals.
+    
+    Queries must test the bit with a literal (not a bound parameter) so the
+    planner can match the index predicate.
+    """
+    return [
+        Index(
+            f"idx_deals_day{i}",
+            "venue_id",
+            postgresql_where=text(f"is_active AND (days_mask & {1 << i}) <> 0"),
+        )
+        for i in range(7)
+    ]
+
+
 class User(Base):
     """User model."""
     
@@ -49,7 +71,7 @@ class User(Base):
     email = Column(String(255), unique=True, nullable=False, index=True)
     hashed_password = Column(String(255))
     provider_sub = Column(String(255), unique=True)  # OAuth provider subject
-    role = Column(Enum(UserRole), nullable=False, default=UserRole.USER)
+    role = Column(IntEnumType(UserRole), nullable=False, default=UserRole.USER)
     first_name = Column(String(100))
     last_name = Column(String(100))
     phone = Column(String(20))
@@ -62,7 +84,7 @@ class User(Base):
     # Relationships
     venues = relationship("Venue", back_populates="vendor")
     favorites = relationship("Favorite", back_populates="user")
-    flags = relationship("Flag", back_populates="user")
+    flags = relationship("Flag", back_populates="user", foreign_keys="Flag.user_id")
     event_logs = relationship("EventLog", back_populates="user")
 
 
@@ -79,9 +101,10 @@ class Venue(Base):
     # Location
     address = Column(String(500), nullable=False)
     city = Column(String(100), nullable=False, index=True)
-    province = Column(Enum(Province), nullable=False, index=True)
+    province = Column(IntEnumType(Province), nullable=False, index=True)
     postal_code = Column(String(10))
     geo = Column(Geometry("POINT", srid=4326))  # PostGIS point
+    h3_res9 = Column(BigInteger, index=True)  # H3 cell of geo, for nearby prefiltering
     
     # Contact
     phone = Column(String(20))
@@ -89,9 +112,9 @@ class Venue(Base):
     website = Column(String(500))
     
     # Business details
-    license_type = Column(Enum(LicenseType), nullable=False)
+    license_type = Column(IntEnumType(LicenseType), nullable=False)
     vendor_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
-    status = Column(Enum(VenueStatus), default=VenueStatus.PENDING, index=True)
+    status = Column(IntEnumType(VenueStatus), default=VenueStatus.PENDING, index=True)
     
     # Features
     has_patio = Column(Boolean, default=False)
@@ -115,7 +138,11 @@ class Venue(Base):
     
     # Indexes
     __table_args__ = (
-        UniqueConstraint("vendor_id", "name", name="uq_venue_vendor_name"),
+        # Venue names are unique per vendor, ignoring case
+        Index("uq_venue_vendor_name", "vendor_id", func.lower(name), unique=True),
+        # Filtered searches, newest first (search_by_filters)
+        Index("idx_venues_province_status_created", "province", "status", text("created_at DESC")),
+        Index("idx_venues_status_created", "status", text("created_at DESC")),
     )
 
 
@@ -126,7 +153,7 @@ class Hours(Base):
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     venue_id = Column(UUID(as_uuid=True), ForeignKey("venues.id"), nullable=False)
-    day = Column(Enum(DayOfWeek), nullable=False)
+    day = Column(IntEnumType(DayOfWeek), nullable=False)
     open_time = Column(Time)
     close_time = Column(Time)
     is_closed = Column(Boolean, default=False)
@@ -147,8 +174,8 @@ class SecondaryHours(Base):
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     venue_id = Column(UUID(as_uuid=True), ForeignKey("venues.id"), nullable=False)
-    type = Column(Enum(SecondaryHoursType), nullable=False)
-    day = Column(Enum(DayOfWeek), nullable=False)
+    type = Column(IntEnumType(SecondaryHoursType), nullable=False)
+    day = Column(IntEnumType(DayOfWeek), nullable=False)
     start_time = Column(Time, nullable=False)
     end_time = Column(Time, nullable=False)
     is_active = Column(Boolean, default=True)
@@ -171,7 +198,7 @@ class Deal(Base):
     venue_id = Column(UUID(as_uuid=True), ForeignKey("venues.id"), nullable=False, index=True)
     title = Column(String(255), nullable=False)
     description = Column(Text)
-    category = Column(Enum(DealCategory), nullable=False, index=True)
+    category = Column(IntEnumType(DealCategory), nullable=False, index=True)
     
     # Pricing
     original_price = Column(Float)
@@ -179,7 +206,7 @@ class Deal(Base):
     price_display_mode = Column(Enum(PriceDisplayMode), default=PriceDisplayMode.SHOW)
     
     # Timing
-    days_mask = Column(Integer, default=0)  # Bitmask for days
+    days_mask = Column(SmallInteger, default=0)  # Bitmask for days (7 bits)
     start_time = Column(Time)
     end_time = Column(Time)
     
@@ -195,6 +222,10 @@ class Deal(Base):
     is_featured = Column(Boolean, default=False, index=True)
     requires_age_verification = Column(Boolean, default=False)
     
+    # Content tags (see ComplianceService); NULL until the deal is next written
+    is_alcohol = Column(Boolean)
+    is_happy_hour_marketing = Column(Boolean)
+    
     # Verification
     last_verified_at = Column(DateTime)
     verified_by = Column(UUID(as_uuid=True), ForeignKey("users.id"))
@@ -208,8 +239,9 @@ class Deal(Base):
     
     # Indexes
     __table_args__ = (
-        # Composite index for active deals by venue
-        # Index("idx_deals_venue_active", "venue_id", "is_active"),
+        # Active deals by venue (partial: nearly every read filters is_active)
+        Index("idx_deals_venue_active", "venue_id", postgresql_where=text("is_active")),
+        *_deal_day_indexes(),
     )
 
 
@@ -219,7 +251,7 @@ class ProvinceRule(Base):
     __tablename__ = "province_rules"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    province = Column(Enum(Province), unique=True, nullable=False)
+    province = Column(IntEnumType(Province), unique=True, nullable=False)
     allow_price_display = Column(Boolean, default=True)
     brand_logo_ok = Column(Boolean, default=True)
     disclaimer = Column(Text)
@@ -323,8 +355,22 @@ class Flag(Base):
     
     # Indexes
     __table_args__ = (
-        # Index("idx_flags_target", "target_type", "target_id"),
-        # Index("idx_flags_status", "status"),
+        Index("idx_flags_target", "target_type", "target_id"),
+        # Moderation queue: pending flags, newest first
+        Index(
+            "idx_flags_pending_created",
+            text("created_at DESC"),
+            postgresql_where=text("status = 'PENDING'"),
+        ),
+        # One open flag per user and target; backs FlagRepository.create_if_absent
+        Index(
+            "uq_flags_pending_user_target",
+            "user_id",
+            "target_type",
+            "target_id",
+            unique=True,
+            postgresql_where=text("status = 'PENDING'"),
+        ),
     )
 
 
@@ -333,7 +379,9 @@ class EventLog(Base):
     
     __tablename__ = "event_logs"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Generated by the database, so ORM inserts, COPY and bulk INSERTs all get
+    # their IDs the same way
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"))
     type = Column(Enum(EventType), nullable=False, index=True)
     target_type = Column(String(50))  # "DEAL", "VENUE"
@@ -341,14 +389,41 @@ class EventLog(Base):
     session_id = Column(String(255))
     ip_address = Column(String(45))
     user_agent = Column(Text)
-    meta = Column(Text)  # JSON string
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    meta = Column(JSONB, nullable=False, default=dict, server_default=text("'{}'::jsonb"))
+    created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationships
     user = relationship("User", back_populates="event_logs")
     
     # Indexes for analytics queries
     __table_args__ = (
-        # Index("idx_events_type_created", "type", "created_at"),
-        # Index("idx_events_target_created", "target_type", "target_id", "created_at"),
+        Index("idx_events_type_created", "type", text("created_at DESC")),
+        Index("idx_events_target_created", "target_type", "target_id", "created_at"),
+        # Append-only log: BRIN keeps time-range scans cheap at a fraction of
+        # the size of a btree on created_at
+        Index("idx_events_created_brin", "created_at", postgresql_using="brin"),
+        # Containment (@>) filters on event metadata
+        Index(
+            "idx_event_meta_gin",
+            "meta",
+            postgresql_using="gin",
+            postgresql_ops={"meta": "jsonb_path_ops"},
+        ),
+    )
+
+
+class EventLogHourlyRollup(Base):
+    """Hourly event counts per target, maintained as events are written."""
+    
+    __tablename__ = "event_log_hourly_rollup"
+    
+    target_type = Column(String(50), primary_key=True)
+    target_id = Column(UUID(as_uuid=True), primary_key=True)
+    hour_bucket = Column(DateTime, primary_key=True)
+    type = Column(Enum(EventType), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    
+    # Indexes for popularity queries
+    __table_args__ = (
+        Index("idx_rollup_type_hour", "target_type", "hour_bucket"),
     )
@@ -1,77 +1,117 @@
 """Province rule repository implementation."""
 
 import uuid
-from typing import List, Optional
+from typing import Any, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import event, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
+from core.cache import TTLCache
 from domain.entities import ProvinceRule
 from domain.enums import Province
 from repositories.base import BaseRepository
 from repositories.models import ProvinceRule as ProvinceRuleModel
 
+# Province rules are reference data that only change on admin updates, so they
+# are cached per process instead of being fetched on every compliance check.
+# Other workers pick up an update once their entries expire. Callers get copies
+# so mutating a returned rule can't leak into the shared cache.
+RULES_CACHE_TTL_SECONDS = 300
+_ALL_RULES_KEY = "*"
+_rules_cache: TTLCache[str, Any] = TTLCache(ttl=RULES_CACHE_TTL_SECONDS)
+
+# Session.info flag: the session's transaction has written rules. Such a
+# session reads around the cache (to see its own writes without caching them)
+# and the cache is dropped once the transaction commits.
+_RULES_WRITTEN = "province_rules_written"
+
+
+def _on_commit(session: Session) -> None:
+    """Drop cached rules after a transaction that wrote them commits."""
+    if session.info.pop(_RULES_WRITTEN, False):
+        _rules_cache.clear()
+
+
+def _on_rollback(session: Session) -> None:
+    """Forget rule writes rolled back with their transaction."""
+    session.info.pop(_RULES_WRITTEN, None)
+
 
 class ProvinceRuleRepositoryImpl(BaseRepository[ProvinceRule, ProvinceRuleModel]):
     """Province rule repository implementation."""
     
     def __init__(self, db: AsyncSession):
-        super().__init__(db, ProvinceRuleModel)
+        super().__init__(db, ProvinceRuleModel, ProvinceRule)
     
     async def get_by_province(self, province: str) -> Optional[ProvinceRule]:
         """Get province rule by province."""
+        province = Province(province)
+        use_cache = not self._wrote_rules()
+        cached = _rules_cache.get(province.value) if use_cache else None
+        if cached is not None:
+            return cached.model_copy()
+        
         result = await self.db.execute(
-            select(ProvinceRuleModel).where(ProvinceRuleModel.province == Province(province))
+            select(ProvinceRuleModel).where(ProvinceRuleModel.province == province)
         )
         db_obj = result.scalar_one_or_none()
-        return self._model_to_entity(db_obj) if db_obj else None
+        if not db_obj:
+            return None
+        
+        rule = self._model_to_entity(db_obj)
+        if use_cache:
+            _rules_cache.set(province.value, rule)
+        return rule.model_copy()
     
     async def list_all(self) -> List[ProvinceRule]:
         """List all province rules."""
+        use_cache = not self._wrote_rules()
+        cached = _rules_cache.get(_ALL_RULES_KEY) if use_cache else None
+        if cached is not None:
+            return [rule.model_copy() for rule in cached]
+        
         result = await self.db.execute(
             select(ProvinceRuleModel).order_by(ProvinceRuleModel.province)
         )
         db_objects = result.scalars().all()
-        return [self._model_to_entity(obj) for obj in db_objects]
+        rules = [self._model_to_entity(obj) for obj in db_objects]
+        if use_cache:
+            _rules_cache.set(_ALL_RULES_KEY, rules)
+        return [rule.model_copy() for rule in rules]
     
-    def _entity_to_model(self, entity: ProvinceRule) -> ProvinceRuleModel:
-        """Convert ProvinceRule entity to ProvinceRuleModel."""
-        return ProvinceRuleModel(
-            id=entity.id,
-            province=entity.province,
-            allow_price_display=entity.allow_price_display,
-            brand_logo_ok=entity.brand_logo_ok,
-            disclaimer=entity.disclaimer,
-            require_age_verification=entity.require_age_verification,
-            min_age=entity.min_age,
-            hide_alcohol_brands=entity.hide_alcohol_brands,
-            hide_alcohol_prices=entity.hide_alcohol_prices,
-            require_food_with_alcohol=entity.require_food_with_alcohol,
-            alcohol_sales_start_time=entity.alcohol_sales_start_time,
-            alcohol_sales_end_time=entity.alcohol_sales_end_time,
-            allow_happy_hour_marketing=entity.allow_happy_hour_marketing,
-            max_discount_percentage=entity.max_discount_percentage,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
-        )
+    async def create(self, rule: ProvinceRule) -> ProvinceRule:
+        """Create province rule; cached rules are dropped on commit."""
+        self._invalidate_on_commit()
+        return await super().create(rule)
     
-    def _model_to_entity(self, model: ProvinceRuleModel) -> ProvinceRule:
-        """Convert ProvinceRuleModel to ProvinceRule entity."""
-        return ProvinceRule(
-            id=model.id,
-            province=model.province,
-            allow_price_display=model.allow_price_display,
-            brand_logo_ok=model.brand_logo_ok,
-            disclaimer=model.disclaimer,
-            require_age_verification=model.require_age_verification,
-            min_age=model.min_age,
-            hide_alcohol_brands=model.hide_alcohol_brands,
-            hide_alcohol_prices=model.hide_alcohol_prices,
-            require_food_with_alcohol=model.require_food_with_alcohol,
-            alcohol_sales_start_time=model.alcohol_sales_start_time,
-            alcohol_sales_end_time=model.alcohol_sales_end_time,
-            allow_happy_hour_marketing=model.allow_happy_hour_marketing,
-            max_discount_percentage=model.max_discount_percentage,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
-        )
+    async def update(self, rule: ProvinceRule) -> ProvinceRule:
+        """Update province rule; cached rules are dropped on commit."""
+        self._invalidate_on_commit()
+        return await super().update(rule)
+    
+    async def patch(self, rule_id: uuid.UUID, **values: Any) -> Optional[ProvinceRule]:
+        """Set columns on a province rule; cached rules are dropped on commit."""
+        self._invalidate_on_commit()
+        return await super().patch(rule_id, **values)
+    
+    async def delete(self, rule_id: uuid.UUID) -> bool:
+        """Delete province rule; cached rules are dropped on commit."""
+        self._invalidate_on_commit()
+        return await super().delete(rule_id)
+    
+    def _wrote_rules(self) -> bool:
+        """Whether this session's transaction has written rules."""
+        return self.db.sync_session.info.get(_RULES_WRITTEN, False)
+    
+    def _invalidate_on_commit(self) -> None:
+        """Clear the rules cache once this session's transaction commits.
+        
+        Clearing before the commit would let a concurrent read re-cache the old
+        rule, and leave the cache wrong if the transaction rolled back.
+        """
+        session = self.db.sync_session
+        session.info[_RULES_WRITTEN] = True
+        if not event.contains(session, "after_commit", _on_commit):
+            event.listen(session, "after_commit", _on_commit)
+            event.listen(session, "after_rollback", _on_rollback)
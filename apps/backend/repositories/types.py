@@ -0,0 +1,57 @@
+"""Custom SQLAlchemy column types."""
+
+from enum import Enum as PyEnum
+from typing import Any, Dict, Generic, Optional, Type, TypeVar
+
+from sqlalchemy import SmallInteger
+from sqlalchemy.types import TypeDecorator
+
+E = TypeVar("E", bound=PyEnum)
+
+
+class IntEnumType(TypeDecorator, Generic[E]):
+    """Store a Python enum as a SMALLINT code.
+
+    Codes are the 1-based position of each member in the enum definition, so
+    new members must only ever be appended — reordering or removing members
+    changes the meaning of rows already on disk.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: Type[E], *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.enum_class = enum_class
+        self._to_code: Dict[E, int] = {
+            member: code for code, member in enumerate(enum_class, start=1)
+        }
+        self._from_code: Dict[int, E] = {
+            code: member for member, code in self._to_code.items()
+        }
+
+    def code_of(self, value: Any) -> Optional[int]:
+        """Get the stored code for an enum member (or its value)."""
+        if value is None:
+            return None
+        return self._to_code[self.enum_class(value)]
+
+    def decode(self, code: Optional[int]) -> Optional[E]:
+        """Get the enum member for a stored code."""
+        if code is None:
+            return None
+        return self._from_code[code]
+
+    def process_bind_param(self, value: Any, dialect: Any) -> Optional[int]:
+        return self.code_of(value)
+
+    def process_literal_param(self, value: Any, dialect: Any) -> str:
+        code = self.code_of(value)
+        return "NULL" if code is None else str(code)
+
+    def process_result_value(self, value: Optional[int], dialect: Any) -> Optional[E]:
+        return self.decode(value)
+
+    @property
+    def python_type(self) -> Type[E]:
+        return self.enum_class
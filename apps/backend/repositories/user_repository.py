@@ -1,22 +1,69 @@
 """User repository implementation."""
 
 import uuid
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.exceptions import BusinessRuleError
 from domain.entities import User
 from domain.enums import UserRole
-from repositories.base import BaseRepository
+from repositories.base import SQL_UTC_NOW, BaseRepository
 from repositories.models import User as UserModel
 
+# Unique index behind User.email
+EMAIL_INDEX = "ix_users_email"
+
+
+def _violated_constraint(exc: IntegrityError) -> Optional[str]:
+    """Get the name of the constraint or index an IntegrityError violated."""
+    # The asyncpg error the DBAPI adapter wraps carries the name
+    return getattr(exc.orig.__cause__, "constraint_name", None)
+
 
 class UserRepositoryImpl(BaseRepository[User, UserModel]):
     """User repository implementation."""
     
     def __init__(self, db: AsyncSession):
-        super().__init__(db, UserModel)
+        super().__init__(db, UserModel, User)
+    
+    async def update(self, user: User) -> Optional[User]:
+        """Update user in one round trip. Returns None if it doesn't exist.
+        
+        Raises BusinessRuleError (DUPLICATE_EMAIL) if the new email is taken.
+        """
+        values = self._model_values(user, exclude_unset=True)
+        values.pop("id", None)
+        try:
+            return await self.patch(user.id, **values)
+        except IntegrityError as e:
+            if _violated_constraint(e) == EMAIL_INDEX:
+                raise BusinessRuleError(
+                    f"Email {user.email} is already in use",
+                    code="DUPLICATE_EMAIL"
+                ) from e
+            raise
+    
+    async def touch_last_login(self, user_id: uuid.UUID) -> Optional[User]:
+        """Set last_login_at to the database's current UTC time.
+        
+        Returns None if the user doesn't exist.
+        """
+        return await self.patch(user_id, last_login_at=SQL_UTC_NOW)
+    
+    async def create_if_absent(self, user: User) -> Optional[User]:
+        """Create a user unless the email is taken. Returns None if it is."""
+        result = await self.db.execute(
+            insert(UserModel)
+            .values(**self._model_values(user))
+            .on_conflict_do_nothing(index_elements=["email"])
+            .returning(UserModel)
+        )
+        db_obj = result.scalar_one_or_none()
+        return self._model_to_entity(db_obj) if db_obj else None
     
     async def get_by_email(self, email: str) -> Optional[User]:
         """Get user by email."""
@@ -26,6 +73,17 @@ class UserRepositoryImpl(BaseRepository[User, UserModel]):
         db_obj = result.scalar_one_or_none()
         return self._model_to_entity(db_obj) if db_obj else None
     
+    async def get_by_ids(self, user_ids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, User]:
+        """Get users by IDs in one query, keyed by ID (missing IDs are omitted)."""
+        ids = set(user_ids)
+        if not ids:
+            return {}
+        
+        result = await self.db.execute(
+            select(UserModel).where(UserModel.id.in_(ids))
+        )
+        return {obj.id: self._model_to_entity(obj) for obj in result.scalars()}
+    
     async def list_by_role(self, role: str, limit: int = 100, offset: int = 0) -> List[User]:
         """List users by role."""
         result = await self.db.execute(
@@ -37,39 +95,3 @@ class UserRepositoryImpl(BaseRepository[User, UserModel]):
         )
         db_objects = result.scalars().all()
         return [self._model_to_entity(obj) for obj in db_objects]
-    
-    def _entity_to_model(self, entity: User) -> UserModel:
-        """Convert User entity to UserModel."""
-        return UserModel(
-            id=entity.id,
-            email=entity.email,
-            hashed_password=entity.hashed_password,
-            provider_sub=entity.provider_sub,
-            role=entity.role,
-            first_name=entity.first_name,
-            last_name=entity.last_name,
-            phone=entity.phone,
-            age_verified=entity.age_verified,
-            is_active=entity.is_active,
-            last_login_at=entity.last_login_at,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
-        )
-    
-    def _model_to_entity(self, model: UserModel) -> User:
-        """Convert UserModel to User entity."""
-        return User(
-            id=model.id,
-            email=model.email,
-            hashed_password=model.hashed_password,
-            provider_sub=model.provider_sub,
-            role=model.role,
-            first_name=model.first_name,
-            last_name=model.last_name,
-            phone=model.phone,
-            age_verified=model.age_verified,
-            is_active=model.is_active,
-            last_login_at=model.last_login_at,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
-        )
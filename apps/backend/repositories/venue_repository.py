@@ -1,77 +1,160 @@
 """Venue repository implementation."""
 
+import math
 import uuid
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
 
-from geoalchemy2 import WKTElement
-from sqlalchemy import and_, func, select
+import h3
+from geoalchemy2 import WKBElement, WKTElement
+from geoalchemy2.shape import to_shape
+from shapely.geometry import Point
+from sqlalchemy import BigInteger, and_, any_, func, literal, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import ARRAY, JSON, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from domain.entities import Venue, VenueWithDetails
+from domain.entities import Hours, SecondaryHours, Venue, VenueWithDetails
 from domain.enums import LicenseType, Province, VenueStatus
 from repositories.base import BaseRepository
 from repositories.models import (
     Deal as DealModel,
     Hours as HoursModel,
-    Media as MediaModel,
     SecondaryHours as SecondaryHoursModel,
     Venue as VenueModel,
 )
 
 
+def _json_rows(model: Any, *columns: Any) -> Any:
+    """Correlated subquery aggregating a venue's child rows into a JSON array."""
+    obj = func.json_build_object(
+        *[arg for col in columns for arg in (literal_column(f"'{col.key}'"), col)]
+    )
+    return (
+        select(func.coalesce(func.json_agg(obj), literal_column("'[]'::json"), type_=JSON))
+        .where(model.venue_id == VenueModel.id)
+        .correlate(VenueModel)
+        .scalar_subquery()
+    )
+
+
+# Hours, secondary hours and active deal count for each selected venue, so
+# detail reads are a single round trip
+_DETAIL_COLUMNS = (
+    _json_rows(
+        HoursModel,
+        HoursModel.venue_id,
+        HoursModel.day,
+        HoursModel.open_time,
+        HoursModel.close_time,
+        HoursModel.is_closed,
+    ).label("hours"),
+    _json_rows(
+        SecondaryHoursModel,
+        SecondaryHoursModel.venue_id,
+        SecondaryHoursModel.type,
+        SecondaryHoursModel.day,
+        SecondaryHoursModel.start_time,
+        SecondaryHoursModel.end_time,
+        SecondaryHoursModel.is_active,
+    ).label("secondary_hours"),
+    select(func.count(DealModel.id))
+    .where(and_(DealModel.venue_id == VenueModel.id, DealModel.is_active == True))
+    .correlate(VenueModel)
+    .scalar_subquery()
+    .label("deals_count"),
+)
+
+# Nearby prefilter on Venue.h3_res9. Resolution 9 cells average ~0.2km per
+# edge; rings are sized on a 0.15km edge so the disk always covers the search
+# circle. Past the max radius the cell list outgrows the btree win.
+H3_RESOLUTION = 9
+H3_PREFILTER_MAX_RADIUS_KM = 5.0
+_H3_RING_STEP_KM = 1.5 * 0.15
+
+
+def h3_cell(lat: float, lng: float) -> int:
+    """Get the H3 cell (as stored in Venue.h3_res9) containing a point."""
+    return h3.str_to_int(h3.latlng_to_cell(lat, lng, H3_RESOLUTION))
+
+
+def h3_cells_within(lat: float, lng: float, radius_km: float) -> List[int]:
+    """Get H3 cells covering a circle around a point."""
+    k = math.ceil(radius_km / _H3_RING_STEP_KM) + 1
+    origin = h3.latlng_to_cell(lat, lng, H3_RESOLUTION)
+    return [h3.str_to_int(cell) for cell in h3.grid_disk(origin, k)]
+
+
+# Enum columns come back from json_build_object as raw SMALLINT codes
+_DAY_TYPE = HoursModel.__table__.c.day.type
+_SECONDARY_TYPE_TYPE = SecondaryHoursModel.__table__.c.type.type
+
+
 class VenueRepositoryImpl(BaseRepository[Venue, VenueModel]):
     """Venue repository implementation."""
     
     def __init__(self, db: AsyncSession):
-        super().__init__(db, VenueModel)
+        super().__init__(db, VenueModel, Venue)
     
-    async def get_by_id(self, venue_id: uuid.UUID) -> Optional[VenueWithDetails]:
-        """Get venue by ID with details."""
+    async def create_if_absent(self, venue: Venue) -> Optional[Venue]:
+        """Create a venue unless its vendor has one with the same name (ignoring case).
+        
+        Returns None on conflict with uq_venue_vendor_name.
+        """
         result = await self.db.execute(
-            select(VenueModel)
-            .options(
-                selectinload(VenueModel.hours),
-                selectinload(VenueModel.secondary_hours),
-                selectinload(VenueModel.media),
+            insert(VenueModel)
+            .values(**self._model_values(venue))
+            .on_conflict_do_nothing(
+                index_elements=[VenueModel.vendor_id, func.lower(VenueModel.name)]
             )
-            .where(VenueModel.id == venue_id)
+            .returning(VenueModel)
         )
         db_obj = result.scalar_one_or_none()
-        if not db_obj:
-            return None
+        return self._model_to_entity(db_obj) if db_obj else None
+    
+    async def set_status(self, venue_id: uuid.UUID, status: VenueStatus) -> Optional[Venue]:
+        """Set a venue's status. Returns None if it doesn't exist."""
+        return await self.patch(venue_id, status=status)
+    
+    async def verify(self, venue_id: uuid.UUID) -> Optional[Venue]:
+        """Mark venue as verified. Returns None if it doesn't exist."""
+        return await self.patch(venue_id, last_verified_at=datetime.utcnow())
+    
+    async def get_by_id_summary(self, venue_id: uuid.UUID) -> Optional[Venue]:
+        """Get venue by ID without hours or deal counts."""
+        return await super().get_by_id(venue_id)
+    
+    async def get_by_ids(self, venue_ids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, Venue]:
+        """Get venues (without details) by IDs in one query, keyed by ID."""
+        ids = set(venue_ids)
+        if not ids:
+            return {}
         
-        # Get deals count
-        deals_count_result = await self.db.execute(
-            select(func.count(DealModel.id))
-            .where(and_(DealModel.venue_id == venue_id, DealModel.is_active == True))
+        result = await self.db.execute(
+            select(VenueModel).where(VenueModel.id.in_(ids))
+        )
+        return {obj.id: self._model_to_entity(obj) for obj in result.scalars()}
+    
+    async def get_by_id(self, venue_id: uuid.UUID) -> Optional[VenueWithDetails]:
+        """Get venue by ID with details."""
+        result = await self.db.execute(
+            select(VenueModel, *_DETAIL_COLUMNS).where(VenueModel.id == venue_id)
         )
-        deals_count = deals_count_result.scalar() or 0
+        row = result.one_or_none()
+        if not row:
+            return None
         
-        return self._model_to_venue_with_details(db_obj, deals_count)
+        return self._row_to_venue_with_details(row)
     
     async def get_by_slug(self, slug: str) -> Optional[VenueWithDetails]:
         """Get venue by slug."""
         result = await self.db.execute(
-            select(VenueModel)
-            .options(
-                selectinload(VenueModel.hours),
-                selectinload(VenueModel.secondary_hours),
-                selectinload(VenueModel.media),
-            )
-            .where(VenueModel.slug == slug)
+            select(VenueModel, *_DETAIL_COLUMNS).where(VenueModel.slug == slug)
         )
-        db_obj = result.scalar_one_or_none()
-        if not db_obj:
+        row = result.one_or_none()
+        if not row:
             return None
         
-        # Get deals count
-        deals_count_result = await self.db.execute(
-            select(func.count(DealModel.id))
-            .where(and_(DealModel.venue_id == db_obj.id, DealModel.is_active == True))
-        )
-        deals_count = deals_count_result.scalar() or 0
-        
-        return self._model_to_venue_with_details(db_obj, deals_count)
+        return self._row_to_venue_with_details(row)
     
     async def list_by_vendor(self, vendor_id: uuid.UUID, limit: int = 100, offset: int = 0) -> List[Venue]:
         """List venues by vendor."""
@@ -97,45 +180,46 @@ class VenueRepositoryImpl(BaseRepository[Venue, VenueModel]):
         # Create point from coordinates
         point = WKTElement(f"POINT({lng} {lat})", srid=4326)
         
-        # Calculate distance and filter by radius
-        result = await self.db.execute(
-            select(
-                VenueModel,
-                func.ST_Distance(VenueModel.geo, point).label("distance")
+        conditions = [
+            VenueModel.geo.isnot(None),
+            func.ST_DWithin(
+                VenueModel.geo,
+                point,
+                radius_km * 1000  # Convert km to meters
             )
-            .options(
-                selectinload(VenueModel.hours),
-                selectinload(VenueModel.secondary_hours),
-                selectinload(VenueModel.media),
-            )
-            .where(
-                and_(
-                    VenueModel.geo.isnot(None),
-                    func.ST_DWithin(
-                        VenueModel.geo,
-                        point,
-                        radius_km * 1000  # Convert km to meters
-                    )
-                )
+        ]
+        
+        # Small radii: narrow candidates with a btree lookup on H3 cells
+        # before PostGIS refines them. Venues without a cell yet (written
+        # before h3_res9 existed; see ops/scripts/backfill_h3.py) still match.
+        if radius_km <= H3_PREFILTER_MAX_RADIUS_KM:
+            cells = literal(h3_cells_within(lat, lng, radius_km), ARRAY(BigInteger))
+            conditions.append(
+                or_(VenueModel.h3_res9.is_(None), VenueModel.h3_res9 == any_(cells))
             )
-            .order_by("distance")
+        
+        # Pick the page of nearby venue IDs first, so details are only
+        # aggregated for the venues actually returned
+        distance = func.ST_Distance(VenueModel.geo, point).label("distance")
+        nearby = (
+            select(VenueModel.id, distance)
+            .where(and_(*conditions))
+            .order_by(distance)
             .offset(offset)
             .limit(limit)
+            .cte("nearby")
         )
         
-        venues_with_distance = result.all()
-        venues_with_details = []
+        result = await self.db.execute(
+            select(VenueModel, *_DETAIL_COLUMNS, nearby.c.distance)
+            .join(nearby, VenueModel.id == nearby.c.id)
+            .order_by(nearby.c.distance)
+        )
         
-        for venue_model, distance in venues_with_distance:
-            # Get deals count
-            deals_count_result = await self.db.execute(
-                select(func.count(DealModel.id))
-                .where(and_(DealModel.venue_id == venue_model.id, DealModel.is_active == True))
-            )
-            deals_count = deals_count_result.scalar() or 0
-            
-            venue_details = self._model_to_venue_with_details(venue_model, deals_count)
-            venue_details.distance_km = distance / 1000  # Convert meters to km
+        venues_with_details = []
+        for row in result.all():
+            venue_details = self._row_to_venue_with_details(row)
+            venue_details.distance_km = row.distance / 1000  # Convert meters to km
             venues_with_details.append(venue_details)
         
         return venues_with_details
@@ -151,11 +235,7 @@ class VenueRepositoryImpl(BaseRepository[Venue, VenueModel]):
         offset: int = 0
     ) -> List[VenueWithDetails]:
         """Search venues by filters."""
-        stmt = select(VenueModel).options(
-            selectinload(VenueModel.hours),
-            selectinload(VenueModel.secondary_hours),
-            selectinload(VenueModel.media),
-        )
+        stmt = select(VenueModel, *_DETAIL_COLUMNS)
         
         conditions = []
         
@@ -186,109 +266,35 @@ class VenueRepositoryImpl(BaseRepository[Venue, VenueModel]):
         stmt = stmt.offset(offset).limit(limit).order_by(VenueModel.created_at.desc())
         
         result = await self.db.execute(stmt)
-        db_objects = result.scalars().all()
-        
-        venues_with_details = []
-        for venue_model in db_objects:
-            # Get deals count
-            deals_count_result = await self.db.execute(
-                select(func.count(DealModel.id))
-                .where(and_(DealModel.venue_id == venue_model.id, DealModel.is_active == True))
-            )
-            deals_count = deals_count_result.scalar() or 0
-            
-            venues_with_details.append(self._model_to_venue_with_details(venue_model, deals_count))
-        
-        return venues_with_details
+        return [self._row_to_venue_with_details(row) for row in result.all()]
     
-    def _entity_to_model(self, entity: Venue) -> VenueModel:
-        """Convert Venue entity to VenueModel."""
-        return VenueModel(
-            id=entity.id,
-            name=entity.name,
-            slug=entity.slug,
-            description=entity.description,
-            address=entity.address,
-            city=entity.city,
-            province=entity.province,
-            postal_code=entity.postal_code,
-            geo=entity.geo,
-            phone=entity.phone,
-            email=entity.email,
-            website=entity.website,
-            license_type=entity.license_type,
-            vendor_id=entity.vendor_id,
-            status=entity.status,
-            has_patio=entity.has_patio,
-            has_parking=entity.has_parking,
-            has_wifi=entity.has_wifi,
-            is_accessible=entity.is_accessible,
-            google_place_id=entity.google_place_id,
-            last_verified_at=entity.last_verified_at,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
-        )
-    
-    def _model_to_entity(self, model: VenueModel) -> Venue:
-        """Convert VenueModel to Venue entity."""
-        return Venue(
-            id=model.id,
-            name=model.name,
-            slug=model.slug,
-            description=model.description,
-            address=model.address,
-            city=model.city,
-            province=model.province,
-            postal_code=model.postal_code,
-            geo=model.geo,
-            phone=model.phone,
-            email=model.email,
-            website=model.website,
-            license_type=model.license_type,
-            vendor_id=model.vendor_id,
-            status=model.status,
-            has_patio=model.has_patio,
-            has_parking=model.has_parking,
-            has_wifi=model.has_wifi,
-            is_accessible=model.is_accessible,
-            google_place_id=model.google_place_id,
-            last_verified_at=model.last_verified_at,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
-        )
+    def _model_values(self, entity: Venue, exclude_unset: bool = False) -> Dict[str, Any]:
+        """Get the column values of a venue, keeping its H3 cell in sync with geo."""
+        values = super()._model_values(entity, exclude_unset)
+        if "geo" in values:
+            geo = values["geo"]
+            # Venues read back from the database carry geo as a WKBElement
+            if isinstance(geo, (WKBElement, WKTElement)):
+                geo = to_shape(geo)
+            values["h3_res9"] = h3_cell(geo.y, geo.x) if isinstance(geo, Point) else None
+        return values
     
-    def _model_to_venue_with_details(self, model: VenueModel, deals_count: int) -> VenueWithDetails:
-        """Convert VenueModel to VenueWithDetails."""
-        from domain.entities import Hours, SecondaryHours
-        
-        # Convert hours
-        hours = [
-            Hours(
-                venue_id=h.venue_id,
-                day=h.day,
-                open_time=h.open_time,
-                close_time=h.close_time,
-                is_closed=h.is_closed,
-            )
-            for h in model.hours
-        ]
-        
-        # Convert secondary hours
-        secondary_hours = [
-            SecondaryHours(
-                venue_id=sh.venue_id,
-                type=sh.type,
-                day=sh.day,
-                start_time=sh.start_time,
-                end_time=sh.end_time,
-                is_active=sh.is_active,
-            )
-            for sh in model.secondary_hours
-        ]
-        
+    def _row_to_venue_with_details(self, row: Any) -> VenueWithDetails:
+        """Convert a (VenueModel, *_DETAIL_COLUMNS) row to VenueWithDetails."""
         return VenueWithDetails(
-            venue=self._model_to_entity(model),
-            hours=hours,
-            secondary_hours=secondary_hours,
-            deals_count=deals_count,
+            venue=self._model_to_entity(row[0]),
+            hours=[Hours.model_validate(self._decode_hours(h)) for h in row.hours],
+            secondary_hours=[
+                SecondaryHours.model_validate(self._decode_hours(sh))
+                for sh in row.secondary_hours
+            ],
+            deals_count=row.deals_count,
         )
+    
+    @staticmethod
+    def _decode_hours(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Decode enum codes in an aggregated hours object."""
+        data["day"] = _DAY_TYPE.decode(data["day"])
+        if "type" in data:
+            data["type"] = _SECONDARY_TYPE_TYPE.decode(data["type"])
+        return data
@@ -2,21 +2,52 @@
 
 import uuid
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from core.cache import TTLCache
 from domain.entities import EventLog, AnalyticsSummary
 from domain.enums import EventType
 from repositories.interfaces import EventLogRepository
+from services.event_sink import (
+    DURABLE_EVENT_TYPES,
+    EventLogSink,
+    get_event_sink,
+    on_events_written,
+    write_events,
+)
 from core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Dashboards poll the same summaries, so they are cached per process for a
+# short TTL, keyed by target and then by minute-bucketed date window. Writing
+# an event for a target drops its entry; for buffered events that happens when
+# the sink has written them, so a summary recomputed in between isn't kept.
+SUMMARY_CACHE_TTL_SECONDS = 60
+_summary_cache: TTLCache[
+    Tuple[str, uuid.UUID], Dict[Tuple[datetime, datetime], AnalyticsSummary]
+] = TTLCache(ttl=SUMMARY_CACHE_TTL_SECONDS, maxsize=10_000)
+
+
+@on_events_written
+def _drop_summaries(events: List[EventLog]) -> None:
+    """Drop cached summaries of the targets of written events."""
+    for target in {(event.target_type, event.target_id) for event in events}:
+        _summary_cache.pop(target)
+
 
 class AnalyticsService:
     """Service for analytics and event tracking."""
     
-    def __init__(self, event_repo: EventLogRepository):
+    def __init__(
+        self,
+        event_repo: EventLogRepository,
+        event_sink: Optional[EventLogSink] = None
+    ):
         self.event_repo = event_repo
+        # Buffer through the process-wide sink, which writes and commits in its
+        # own sessions; without one, events are written inline
+        self.event_sink = event_sink or get_event_sink()
         self.logger = get_logger(self.__class__.__name__)
     
     async def track_event(
@@ -39,20 +70,33 @@ class AnalyticsService:
             target_type=target_type,
             target_id=target_id,
             session_id=session_id,
-            meta=meta or {},
             ip_address=ip_address,
             user_agent=user_agent,
             latitude=latitude,
             longitude=longitude,
         )
+        # Events without metadata keep the shared EMPTY_META default
+        if meta:
+            event.meta = meta
         
-        created_event = await self.event_repo.create(event)
+        # Hand off to the background writer; write inline if durable, there is
+        # no writer, or it is full
+        if (
+            event_type not in DURABLE_EVENT_TYPES
+            and self.event_sink is not None
+            and self.event_sink.submit(event)
+        ):
+            created_event = event
+        else:
+            created_event = await self.event_repo.create(event)
+            _summary_cache.pop((target_type, target_id))
+        # Below the configured level the filtering logger makes this a no-op
         self.logger.debug(
             "Event tracked",
             event_type=event_type.value,
             target_type=target_type,
-            target_id=str(target_id),
-            user_id=str(user_id) if user_id else None
+            target_id=target_id,
+            user_id=user_id
         )
         
         return created_event
@@ -62,38 +106,61 @@ class AnalyticsService:
         if not events:
             return []
         
-        created_events = await self.event_repo.create_batch(events)
-        self.logger.info(
-            "Batch events tracked",
-            count=len(created_events),
-            event_types=[e.type.value for e in created_events]
-        )
+        if any(e.type in DURABLE_EVENT_TYPES for e in events):
+            await self.event_repo.create_batch(events)
+        else:
+            # Relaxed durability applies to a whole transaction, so telemetry
+            # commits in its own session rather than the request's
+            await write_events(events)
+        _drop_summaries(events)
+        self.logger.info("Batch events tracked", count=len(events))
         
-        return created_events
+        return events
     
     async def get_analytics_summary(
         self,
         target_id: uuid.UUID,
         target_type: str,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
+        end_date: Optional[datetime] = None,
+        meta_filter: Optional[Dict[str, Any]] = None
     ) -> AnalyticsSummary:
-        """Get analytics summary for a target."""
+        """Get analytics summary for a target, optionally filtered on event metadata."""
         # Default to last 30 days if no dates provided
         if not end_date:
             end_date = datetime.utcnow()
         if not start_date:
             start_date = end_date - timedelta(days=30)
         
+        # Bucket to the minute so repeated polls share a cache entry
+        start_date = start_date.replace(second=0, microsecond=0)
+        end_date = end_date.replace(second=0, microsecond=0)
+        
+        target = (target_type, target_id)
+        window = (start_date, end_date)
+        if not meta_filter:
+            windows = _summary_cache.get(target)
+            if windows and window in windows:
+                return windows[window].model_copy()
+        
         # Convert to ISO strings
         start_str = start_date.isoformat()
         end_str = end_date.isoformat()
         
         summary_data = await self.event_repo.get_analytics_summary(
-            target_id, target_type, start_str, end_str
+            target_id, target_type, start_str, end_str, meta_filter
         )
+        summary = AnalyticsSummary(**summary_data)
         
-        return AnalyticsSummary(**summary_data)
+        if not meta_filter:
+            windows = _summary_cache.get(target)
+            if windows is None:
+                windows = {}
+                _summary_cache.set(target, windows)
+            windows[window] = summary
+            return summary.model_copy()
+        
+        return summary
     
     async def track_impression(
         self,
@@ -159,8 +226,8 @@ class AnalyticsService:
         **kwargs
     ) -> EventLog:
         """Track a flag event."""
-        meta = kwargs.get('meta', {})
-        meta['reason'] = reason
+        # Copy rather than mutate the caller's meta
+        meta = {**(kwargs.pop('meta', None) or {}), 'reason': reason}
         
         return await self.track_event(
             EventType.FLAG,
@@ -169,7 +236,7 @@ class AnalyticsService:
             user_id=user_id,
             session_id=session_id,
             meta=meta,
-            **{k: v for k, v in kwargs.items() if k != 'meta'}
+            **kwargs
         )
     
     async def get_popular_venues(
@@ -178,9 +245,8 @@ class AnalyticsService:
         days: int = 7
     ) -> List[Dict[str, Any]]:
         """Get popular venues based on analytics."""
-        # This would typically query the analytics data
-        # For now, return empty list - would need to implement in repository
-        return []
+        since = datetime.utcnow() - timedelta(days=days)
+        return await self.event_repo.list_top_targets("VENUE", since, limit)
     
     async def get_trending_deals(
         self,
@@ -188,6 +254,5 @@ class AnalyticsService:
         days: int = 7
     ) -> List[Dict[str, Any]]:
         """Get trending deals based on analytics."""
-        # This would typically query the analytics data
-        # For now, return empty list - would need to implement in repository
-        return []
+        since = datetime.utcnow() - timedelta(days=days)
+        return await self.event_repo.list_top_targets("DEAL", since, limit)
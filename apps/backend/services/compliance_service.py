@@ -1,5 +1,7 @@
 """Compliance service for province-specific rules."""
 
+import re
+from functools import lru_cache
 from typing import Dict, Optional
 
 from domain.entities import Deal, ProvinceRule, DEFAULT_PROVINCE_RULES
@@ -9,6 +11,38 @@ from core.logging import get_logger
 
 logger = get_logger(__name__)
 
+ALCOHOL_KEYWORDS = (
+    "beer", "wine", "cocktail", "drink", "alcohol", "spirits",
+    "whiskey", "vodka", "gin", "rum", "tequila", "liqueur",
+    "bar", "pub", "brewery", "winery", "distillery",
+)
+
+# Substring matches (e.g. "drinks", "bartender" count), one scan per text
+_ALCOHOL_RE = re.compile("|".join(map(re.escape, ALCOHOL_KEYWORDS)), re.IGNORECASE)
+_HAPPY_HOUR_RE = re.compile("happy hour", re.IGNORECASE)
+
+# Roles that always see prices, whatever the province rules
+_PRICE_VISIBLE_ROLES = frozenset({UserRole.ADMIN, UserRole.VENDOR})
+
+
+def _mentions(pattern: re.Pattern, deal: Deal) -> bool:
+    """Check if a deal's title or description matches a pattern."""
+    return bool(
+        pattern.search(deal.title)
+        or (deal.description and pattern.search(deal.description))
+    )
+
+
+def tag_deal_content(deal: Deal) -> Deal:
+    """Set a deal's content tags from its title and description.
+    
+    Called when a deal is written so compliance checks read the stored tags
+    instead of scanning text on every request.
+    """
+    deal.is_alcohol = _mentions(_ALCOHOL_RE, deal)
+    deal.is_happy_hour_marketing = _mentions(_HAPPY_HOUR_RE, deal)
+    return deal
+
 
 class ComplianceService:
     """Service for applying province-specific compliance rules."""
@@ -16,9 +50,15 @@ class ComplianceService:
     def __init__(self):
         self.rules_cache: Dict[Province, ProvinceRule] = DEFAULT_PROVINCE_RULES.copy()
         self.logger = get_logger(self.__class__.__name__)
+        # Resolved rules (including fallbacks) per province; cleared on updates
+        self._lookup = lru_cache(maxsize=32)(self._resolve_province_rule)
     
     def get_province_rule(self, province: Province) -> ProvinceRule:
         """Get province rule, with fallback to default."""
+        return self._lookup(province)
+    
+    def _resolve_province_rule(self, province: Province) -> ProvinceRule:
+        """Look up a province rule, falling back to Ontario."""
         if province in self.rules_cache:
             return self.rules_cache[province]
         
@@ -36,7 +76,7 @@ class ComplianceService:
         rule = self.get_province_rule(province)
         
         # Admins and vendors can always see prices
-        if user_role in [UserRole.ADMIN, UserRole.VENDOR]:
+        if user_role in _PRICE_VISIBLE_ROLES:
             deal.price_display_mode = PriceDisplayMode.SHOW
             return deal
         
@@ -74,7 +114,7 @@ class ComplianceService:
         
         # Check happy hour marketing restrictions
         if not rule.allow_happy_hour_marketing:
-            if "happy hour" in deal.title.lower() or "happy hour" in (deal.description or "").lower():
+            if self._is_happy_hour_deal(deal):
                 raise BusinessRuleError(
                     f"Happy hour marketing not allowed in {province.value}",
                     code="HAPPY_HOUR_MARKETING_RESTRICTED"
@@ -92,14 +132,16 @@ class ComplianceService:
     
     def _is_alcohol_deal(self, deal: Deal) -> bool:
         """Check if deal involves alcohol."""
-        alcohol_keywords = [
-            "beer", "wine", "cocktail", "drink", "alcohol", "spirits", 
-            "whiskey", "vodka", "gin", "rum", "tequila", "liqueur",
-            "bar", "pub", "brewery", "winery", "distillery"
-        ]
-        
-        text_to_check = f"{deal.title} {deal.description or ''}".lower()
-        return any(keyword in text_to_check for keyword in alcohol_keywords)
+        if deal.is_alcohol is None:
+            # Untagged deal: tag it so repeat checks on it don't rescan
+            tag_deal_content(deal)
+        return deal.is_alcohol
+    
+    def _is_happy_hour_deal(self, deal: Deal) -> bool:
+        """Check if deal is marketed as a happy hour."""
+        if deal.is_happy_hour_marketing is None:
+            tag_deal_content(deal)
+        return deal.is_happy_hour_marketing
     
     def redact_price_info(self, deal: Deal) -> Deal:
         """Redact price information from deal."""
@@ -115,4 +157,5 @@ class ComplianceService:
     def update_rules_cache(self, rules: Dict[Province, ProvinceRule]) -> None:
         """Update the rules cache (for admin updates)."""
         self.rules_cache.update(rules)
+        self._lookup.cache_clear()
         self.logger.info("Province rules cache updated", provinces=list(rules.keys()))
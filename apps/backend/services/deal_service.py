@@ -6,11 +6,32 @@ from typing import List, Optional
 from domain.entities import Deal
 from domain.enums import DealCategory, DayOfWeek
 from repositories.interfaces import DealRepository
+from services.compliance_service import tag_deal_content
 from core.exceptions import BusinessRuleError, NotFoundError
 from core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# (predicate that flags an invalid deal, error code, message), checked in order
+_DEAL_VALIDATORS = (
+    (
+        lambda d: d.original_price is not None and d.deal_price is not None
+        and d.deal_price >= d.original_price,
+        "INVALID_DEAL_PRICING",
+        "Deal price must be less than original price",
+    ),
+    (
+        lambda d: bool(d.start_time and d.end_time) and d.start_time >= d.end_time,
+        "INVALID_TIME_RANGE",
+        "Start time must be before end time",
+    ),
+    (
+        lambda d: d.max_redemptions is not None and d.max_redemptions <= 0,
+        "INVALID_MAX_REDEMPTIONS",
+        "Max redemptions must be positive",
+    ),
+)
+
 
 class DealService:
     """Service for deal business logic."""
@@ -28,8 +49,9 @@ class DealService:
         if not deal.days_mask:
             deal.set_active_days([DayOfWeek.MONDAY, DayOfWeek.TUESDAY, DayOfWeek.WEDNESDAY, DayOfWeek.THURSDAY, DayOfWeek.FRIDAY])
         
+        tag_deal_content(deal)
         created_deal = await self.deal_repo.create(deal)
-        self.logger.info("Deal created", deal_id=str(created_deal.id), venue_id=str(created_deal.venue_id))
+        self.logger.info("Deal created", deal_id=created_deal.id, venue_id=created_deal.venue_id)
         
         return created_deal
     
@@ -46,18 +68,21 @@ class DealService:
         # Validate business rules
         await self._validate_deal_update(deal)
         
+        tag_deal_content(deal)
         updated_deal = await self.deal_repo.update(deal)
-        self.logger.info("Deal updated", deal_id=str(updated_deal.id))
+        if not updated_deal:
+            raise NotFoundError(f"Deal with id {deal.id} not found")
         
+        self.logger.info("Deal updated", deal_id=updated_deal.id)
         return updated_deal
     
     async def delete_deal(self, deal_id: uuid.UUID) -> bool:
         """Delete deal."""
         success = await self.deal_repo.delete(deal_id)
         if success:
-            self.logger.info("Deal deleted", deal_id=str(deal_id))
+            self.logger.info("Deal deleted", deal_id=deal_id)
         else:
-            self.logger.warning("Failed to delete deal", deal_id=str(deal_id))
+            self.logger.warning("Failed to delete deal", deal_id=deal_id)
         
         return success
     
@@ -72,10 +97,11 @@ class DealService:
         radius_km: float = 10.0,
         category: Optional[str] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        day: Optional[str] = None
     ) -> List[Deal]:
         """List active deals nearby."""
-        return await self.deal_repo.list_active_nearby(lat, lng, radius_km, category, limit, offset)
+        return await self.deal_repo.list_active_nearby(lat, lng, radius_km, category, limit, offset, day)
     
     async def list_featured_deals(self, limit: int = 20) -> List[Deal]:
         """List featured deals."""
@@ -83,77 +109,50 @@ class DealService:
     
     async def feature_deal(self, deal_id: uuid.UUID) -> Deal:
         """Feature a deal."""
-        deal = await self.get_deal(deal_id)
-        deal.feature()
-        updated_deal = await self.deal_repo.update(deal)
+        updated_deal = await self.deal_repo.feature(deal_id)
+        if not updated_deal:
+            raise NotFoundError(f"Deal with id {deal_id} not found")
         
-        self.logger.info("Deal featured", deal_id=str(deal_id))
+        self.logger.info("Deal featured", deal_id=deal_id)
         return updated_deal
     
     async def unfeature_deal(self, deal_id: uuid.UUID) -> Deal:
         """Unfeature a deal."""
-        deal = await self.get_deal(deal_id)
-        deal.unfeature()
-        updated_deal = await self.deal_repo.update(deal)
+        updated_deal = await self.deal_repo.unfeature(deal_id)
+        if not updated_deal:
+            raise NotFoundError(f"Deal with id {deal_id} not found")
         
-        self.logger.info("Deal unfeatured", deal_id=str(deal_id))
+        self.logger.info("Deal unfeatured", deal_id=deal_id)
         return updated_deal
     
     async def verify_deal(self, deal_id: uuid.UUID, verified_by: uuid.UUID) -> Deal:
         """Mark deal as verified."""
-        deal = await self.get_deal(deal_id)
-        deal.verify(verified_by)
-        updated_deal = await self.deal_repo.update(deal)
+        updated_deal = await self.deal_repo.verify(deal_id, verified_by)
+        if not updated_deal:
+            raise NotFoundError(f"Deal with id {deal_id} not found")
         
-        self.logger.info("Deal verified", deal_id=str(deal_id), verified_by=str(verified_by))
+        self.logger.info("Deal verified", deal_id=deal_id, verified_by=verified_by)
         return updated_deal
     
     async def redeem_deal(self, deal_id: uuid.UUID) -> bool:
         """Redeem a deal."""
-        deal = await self.get_deal(deal_id)
-        
-        if not deal.is_available:
-            self.logger.warning("Deal not available for redemption", deal_id=str(deal_id))
-            return False
-        
-        success = deal.redeem()
-        if success:
-            await self.deal_repo.update(deal)
-            self.logger.info("Deal redeemed", deal_id=str(deal_id))
-        
-        return success
+        if await self.deal_repo.redeem(deal_id):
+            self.logger.info("Deal redeemed", deal_id=deal_id)
+            return True
+        
+        # Only the failure path pays for a second query, to tell a missing
+        # deal apart from an unavailable one
+        await self.get_deal(deal_id)
+        self.logger.warning("Deal not available for redemption", deal_id=deal_id)
+        return False
     
     async def _validate_deal_creation(self, deal: Deal) -> None:
         """Validate deal creation business rules."""
-        # Validate pricing
-        if deal.original_price is not None and deal.deal_price is not None:
-            if deal.deal_price >= deal.original_price:
-                raise BusinessRuleError(
-                    "Deal price must be less than original price",
-                    code="INVALID_DEAL_PRICING"
-                )
-        
-        # Validate time range
-        if deal.start_time and deal.end_time:
-            if deal.start_time >= deal.end_time:
-                raise BusinessRuleError(
-                    "Start time must be before end time",
-                    code="INVALID_TIME_RANGE"
-                )
-        
-        # Validate redemptions
-        if deal.max_redemptions is not None and deal.max_redemptions <= 0:
-            raise BusinessRuleError(
-                "Max redemptions must be positive",
-                code="INVALID_MAX_REDEMPTIONS"
-            )
+        for is_invalid, code, message in _DEAL_VALIDATORS:
+            if is_invalid(deal):
+                raise BusinessRuleError(message, code=code)
     
     async def _validate_deal_update(self, deal: Deal) -> None:
         """Validate deal update business rules."""
-        # Check if deal exists
-        existing = await self.deal_repo.get_by_id(deal.id)
-        if not existing:
-            raise NotFoundError(f"Deal with id {deal.id} not found")
-        
-        # Re-validate creation rules
+        # Existence is checked by the update itself
         await self._validate_deal_creation(deal)
@@ -0,0 +1,210 @@
+"""Buffered, batched event log writes."""
+
+import asyncio
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from core import database
+from core.logging import get_logger
+from domain.entities import EventLog
+from domain.enums import EventType
+from repositories.event_log_repository import EventLogRepositoryImpl
+
+logger = get_logger(__name__)
+
+FlushFn = Callable[[List[EventLog]], Awaitable[Any]]
+WrittenListener = Callable[[List[EventLog]], None]
+
+# Events moderation and user lists depend on: never written with relaxed
+# durability
+DURABLE_EVENT_TYPES = frozenset({EventType.SAVE, EventType.UNSAVE, EventType.FLAG})
+
+# Called with each group of events a sink has written (e.g. to drop caches
+# derived from them)
+_written_listeners: List[WrittenListener] = []
+
+
+def on_events_written(listener: WrittenListener) -> WrittenListener:
+    """Register a callback run after a sink writes a group of events."""
+    _written_listeners.append(listener)
+    return listener
+
+
+async def write_events(events: List[EventLog]) -> None:
+    """Write a batch of events in its own session.
+    
+    Telemetry batches commit with relaxed durability; any batch containing a
+    durable event type commits normally.
+    """
+    if database.async_session_factory is None:
+        raise RuntimeError("Database not initialized")
+    
+    async with database.async_session_factory() as session:
+        repo = EventLogRepositoryImpl(session)
+        if any(e.type in DURABLE_EVENT_TYPES for e in events):
+            await repo.create_batch(events)
+        else:
+            async with repo.relaxed_durability():
+                await repo.create_batch(events)
+        await session.commit()
+
+
+class EventLogSink:
+    """In-memory buffer that writes events in batches from a background task.
+    
+    Callers hand events over with ``submit`` and return immediately; a
+    flusher task started on first use writes up to ``max_rows`` events at a
+    time, waiting at most ``flush_interval_ms`` for a batch to fill. Each
+    batch is split by (event type, target type) and the groups are written
+    concurrently, at most ``flush_concurrency`` at a time; use 1 if ``flush``
+    shares a database session between calls.
+    
+    Events go into a preallocated ring of ``capacity`` slots. Producers claim
+    the slot at the tail and the single flusher reads from the head, so a
+    submit is a slot write and a counter bump with no queue lock or waiter
+    bookkeeping; the flusher is only woken when the ring goes from empty to
+    non-empty or a full batch is ready.
+    """
+    
+    def __init__(
+        self,
+        flush: FlushFn = write_events,
+        max_rows: int = 1000,
+        flush_interval_ms: int = 200,
+        capacity: int = 10_000,
+        flush_concurrency: int = 4,
+    ):
+        self.flush = flush
+        self.max_rows = max_rows
+        self.flush_interval = flush_interval_ms / 1000
+        self._flush_slots = asyncio.Semaphore(flush_concurrency)
+        self.capacity = capacity
+        self._slots: List[Optional[EventLog]] = [None] * capacity
+        # Monotonic sequence numbers; slot index is seq % capacity
+        self._head = 0  # next to flush, advanced by the flusher only
+        self._tail = 0  # next to fill, advanced by producers only
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task[None]] = None
+        self._closed = False
+    
+    def submit(self, event: EventLog) -> bool:
+        """Buffer an event for writing. Returns False if the buffer is full or closed."""
+        if self._closed:
+            return False
+        
+        pending = self._tail - self._head
+        if pending >= self.capacity:
+            return False
+        
+        self._slots[self._tail % self.capacity] = event
+        self._tail += 1
+        
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        if pending == 0 or pending + 1 == self.max_rows:
+            self._wakeup.set()
+        return True
+    
+    async def aclose(self) -> None:
+        """Stop accepting events and wait for buffered ones to be written."""
+        if self._closed:
+            return
+        self._closed = True
+        
+        if self._task is not None:
+            self._wakeup.set()
+            await self._task
+    
+    async def _run(self) -> None:
+        """Flush batches until closed and drained."""
+        while True:
+            pending = self._tail - self._head
+            if pending == 0:
+                if self._closed:
+                    return
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            
+            # Give a partial batch up to flush_interval to fill
+            if pending < self.max_rows and not self._closed:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+                except asyncio.TimeoutError:
+                    pass
+            
+            await self._flush_batch(self._take(self.max_rows))
+    
+    def _take(self, limit: int) -> List[EventLog]:
+        """Remove up to limit events from the head of the ring."""
+        end = min(self._tail, self._head + limit)
+        batch = []
+        for seq in range(self._head, end):
+            index = seq % self.capacity
+            batch.append(self._slots[index])
+            self._slots[index] = None
+        self._head = end
+        return batch
+    
+    async def _flush_batch(self, batch: List[EventLog]) -> None:
+        """Write one batch as per-type groups."""
+        groups: Dict[Tuple[EventType, str], List[EventLog]] = defaultdict(list)
+        for event in batch:
+            groups[(event.type, event.target_type)].append(event)
+        
+        if len(groups) == 1:
+            await self._flush_group(batch)
+        else:
+            await asyncio.gather(*(self._flush_group(group) for group in groups.values()))
+    
+    async def _flush_group(self, events: List[EventLog]) -> None:
+        """Write one group, logging (not raising) failures."""
+        async with self._flush_slots:
+            try:
+                await self.flush(events)
+            except Exception:
+                logger.exception(
+                    "Event log flush failed",
+                    count=len(events),
+                    event_type=events[0].type.value,
+                )
+                return
+        
+        for listener in _written_listeners:
+            # A failing listener must not take down the flusher task
+            try:
+                listener(events)
+            except Exception:
+                logger.exception(
+                    "Event log written listener failed",
+                    listener=listener.__qualname__,
+                )
+
+
+# Global sink, managed by the application lifespan
+event_sink: Optional[EventLogSink] = None
+
+
+def init_event_sink(**kwargs: Any) -> EventLogSink:
+    """Initialize the global event sink."""
+    global event_sink
+    
+    event_sink = EventLogSink(**kwargs)
+    logger.info("Event sink initialized", max_rows=event_sink.max_rows)
+    return event_sink
+
+
+def get_event_sink() -> Optional[EventLogSink]:
+    """Get the global event sink, if initialized."""
+    return event_sink
+
+
+async def close_event_sink() -> None:
+    """Flush and close the global event sink."""
+    global event_sink
+    
+    if event_sink:
+        await event_sink.aclose()
+        event_sink = None
+        logger.info("Event sink closed")
@@ -29,14 +29,6 @@ class ModerationService:
         user_id: uuid.UUID
     ) -> Flag:
         """Create a new flag/report."""
-        # Check if user already flagged this target
-        existing_flag = await self.flag_repo.get_by_user_and_target(user_id, target_type, target_id)
-        if existing_flag and existing_flag.status == FlagStatus.PENDING:
-            raise BusinessRuleError(
-                "You have already flagged this content",
-                code="DUPLICATE_FLAG"
-            )
-        
         flag = Flag(
             target_type=target_type,
             target_id=target_id,
@@ -46,12 +38,19 @@ class ModerationService:
             status=FlagStatus.PENDING,
         )
         
-        created_flag = await self.flag_repo.create(flag)
+        # A pending flag from this user on the target makes the insert a no-op
+        created_flag = await self.flag_repo.create_if_absent(flag)
+        if not created_flag:
+            raise BusinessRuleError(
+                "You have already flagged this content",
+                code="DUPLICATE_FLAG"
+            )
+        
         self.logger.info(
             "Flag created",
-            flag_id=str(created_flag.id),
+            flag_id=created_flag.id,
             target_type=target_type,
-            target_id=str(target_id),
+            target_id=target_id,
             reason=reason
         )
         
@@ -69,11 +68,13 @@ class ModerationService:
         """List pending flags for moderation."""
         flags = await self.flag_repo.list_pending(limit, offset)
         
+        # Fetch all reporters in one query
+        reporters = await self.user_repo.get_by_ids(flag.user_id for flag in flags)
+        
         # Convert to FlagWithDetails
         flag_details = []
         for flag in flags:
-            # Get reporter info
-            reporter = await self.user_repo.get_by_id(flag.user_id)
+            reporter = reporters.get(flag.user_id)
             reporter_email = reporter.email if reporter else "Unknown"
             
             # Get target name (would need additional queries in real implementation)
@@ -108,8 +109,8 @@ class ModerationService:
         
         self.logger.info(
             "Flag resolved",
-            flag_id=str(flag_id),
-            resolved_by=str(resolved_by),
+            flag_id=flag_id,
+            resolved_by=resolved_by,
             status=FlagStatus.RESOLVED.value
         )
         
@@ -135,8 +136,8 @@ class ModerationService:
         
         self.logger.info(
             "Flag dismissed",
-            flag_id=str(flag_id),
-            resolved_by=str(resolved_by),
+            flag_id=flag_id,
+            resolved_by=resolved_by,
             status=FlagStatus.DISMISSED.value
         )
         
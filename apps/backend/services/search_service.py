@@ -38,7 +38,12 @@ class SearchService:
         
         # Otherwise use filter-based search
         return await self.venue_repo.search_by_filters(
-            query, city, province, license_type, None, limit, offset
+            query=query,
+            city=city,
+            province=province,
+            license_type=license_type,
+            limit=limit,
+            offset=offset
         )
     
     async def search_deals(
@@ -86,19 +91,20 @@ class SearchService:
             lat, lng, radius_km, category, limit, offset
         )
         
+        # Fetch all venues in one query
+        venues = await self.venue_repo.get_by_ids(deal.venue_id for deal in deals)
+        
         # Convert to DealWithVenue format
         feed_items = []
         for deal in deals:
-            # Get venue details for each deal
-            venue = await self.venue_repo.get_by_id(deal.venue_id)
+            venue = venues.get(deal.venue_id)
             if venue:
                 feed_item = DealWithVenue(
                     deal=deal,
-                    venue_name=venue.venue.name,
-                    venue_address=venue.venue.address,
-                    venue_city=venue.venue.city,
-                    venue_province=venue.venue.province.value,
-                    distance_km=venue.distance_km,
+                    venue_name=venue.name,
+                    venue_address=venue.address,
+                    venue_city=venue.city,
+                    venue_province=venue.province,
                     savings_amount=deal.savings_amount,
                     savings_percentage=deal.savings_percentage,
                 )
@@ -114,30 +120,33 @@ class SearchService:
         limit: int = 20
     ) -> List[DealWithVenue]:
         """Get trending deals (featured + popular)."""
-        # Get featured deals first
-        featured_deals = await self.deal_repo.list_featured(limit // 2)
+        # Featured deals first, then popular nearby deals (could be based on
+        # analytics in the future), fetched in a single round trip
+        all_deals = await self.deal_repo.list_trending(lat, lng, radius_km, limit)
         
-        # Get popular deals (could be based on analytics in the future)
-        popular_deals = await self.deal_repo.list_active_nearby(
-            lat, lng, radius_km, None, limit // 2
-        )
+        # Deduplicate, keeping order and stopping once we have enough
+        seen = set()
+        trending_deals = []
+        for deal in all_deals:
+            if deal.id not in seen:
+                seen.add(deal.id)
+                trending_deals.append(deal)
+                if len(trending_deals) == limit:
+                    break
         
-        # Combine and deduplicate
-        all_deals = featured_deals + popular_deals
-        unique_deals = {deal.id: deal for deal in all_deals}.values()
+        venues = await self.venue_repo.get_by_ids(deal.venue_id for deal in trending_deals)
         
         # Convert to DealWithVenue format
         trending_items = []
-        for deal in list(unique_deals)[:limit]:
-            venue = await self.venue_repo.get_by_id(deal.venue_id)
+        for deal in trending_deals:
+            venue = venues.get(deal.venue_id)
             if venue:
                 feed_item = DealWithVenue(
                     deal=deal,
-                    venue_name=venue.venue.name,
-                    venue_address=venue.venue.address,
-                    venue_city=venue.venue.city,
-                    venue_province=venue.venue.province.value,
-                    distance_km=venue.distance_km,
+                    venue_name=venue.name,
+                    venue_address=venue.address,
+                    venue_city=venue.city,
+                    venue_province=venue.province,
                     savings_amount=deal.savings_amount,
                     savings_percentage=deal.savings_percentage,
                 )
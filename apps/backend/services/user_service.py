@@ -1,16 +1,18 @@
 """User service for user management."""
 
 import uuid
-from typing import List, Optional
+from typing import Any, List, Optional
 
 from domain.entities import User, UserProfile
 from domain.enums import UserRole
 from repositories.interfaces import UserRepository
 from core.exceptions import BusinessRuleError, NotFoundError
-from core.logging import get_logger
+from core.logging import get_logger, profile_await
 
 logger = get_logger(__name__)
 
+_ALLOWED_ROLES = frozenset({UserRole.USER, UserRole.VENDOR, UserRole.ADMIN})
+
 
 class UserService:
     """Service for user management."""
@@ -19,16 +21,25 @@ class UserService:
         self.user_repo = user_repo
         self.logger = get_logger(self.__class__.__name__)
     
+    @profile_await
     async def create_user(self, user: User) -> User:
         """Create a new user."""
         # Validate business rules
         await self._validate_user_creation(user)
         
-        created_user = await self.user_repo.create(user)
-        self.logger.info("User created", user_id=str(created_user.id), email=created_user.email)
+        # Email uniqueness is enforced by the insert itself
+        created_user = await self.user_repo.create_if_absent(user)
+        if not created_user:
+            raise BusinessRuleError(
+                f"User with email {user.email} already exists",
+                code="DUPLICATE_EMAIL"
+            )
+        
+        self.logger.info("User created", user_id=created_user.id, email=created_user.email)
         
         return created_user
     
+    @profile_await
     async def get_user(self, user_id: uuid.UUID) -> User:
         """Get user by ID."""
         user = await self.user_repo.get_by_id(user_id)
@@ -41,13 +52,16 @@ class UserService:
         """Get user by email."""
         return await self.user_repo.get_by_email(email)
     
+    @profile_await
     async def update_user(self, user: User) -> User:
         """Update user."""
-        # Validate business rules
-        await self._validate_user_update(user)
-        
+        # Existence and email uniqueness are checked by the update itself (a
+        # taken email raises BusinessRuleError)
         updated_user = await self.user_repo.update(user)
-        self.logger.info("User updated", user_id=str(updated_user.id))
+        if not updated_user:
+            raise NotFoundError(f"User with id {user.id} not found")
+        
+        self.logger.info("User updated", user_id=updated_user.id)
         
         return updated_user
     
@@ -55,9 +69,9 @@ class UserService:
         """Delete user."""
         success = await self.user_repo.delete(user_id)
         if success:
-            self.logger.info("User deleted", user_id=str(user_id))
+            self.logger.info("User deleted", user_id=user_id)
         else:
-            self.logger.warning("Failed to delete user", user_id=str(user_id))
+            self.logger.warning("Failed to delete user", user_id=user_id)
         
         return success
     
@@ -67,42 +81,45 @@ class UserService:
     
     async def verify_user_age(self, user_id: uuid.UUID) -> User:
         """Verify user age."""
-        user = await self.get_user(user_id)
-        user.verify_age()
-        updated_user = await self.user_repo.update(user)
+        updated_user = await self._patch_user(user_id, age_verified=True)
         
-        self.logger.info("User age verified", user_id=str(user_id))
+        self.logger.info("User age verified", user_id=user_id)
         return updated_user
     
     async def update_last_login(self, user_id: uuid.UUID) -> User:
         """Update user's last login timestamp."""
-        user = await self.get_user(user_id)
-        user.update_last_login()
-        updated_user = await self.user_repo.update(user)
+        updated_user = await self.user_repo.touch_last_login(user_id)
+        if not updated_user:
+            raise NotFoundError(f"User with id {user_id} not found")
         
         return updated_user
     
     async def deactivate_user(self, user_id: uuid.UUID) -> User:
         """Deactivate user account."""
-        user = await self.get_user(user_id)
-        user.is_active = False
-        updated_user = await self.user_repo.update(user)
+        updated_user = await self._patch_user(user_id, is_active=False)
         
-        self.logger.info("User deactivated", user_id=str(user_id))
+        self.logger.info("User deactivated", user_id=user_id)
         return updated_user
     
     async def activate_user(self, user_id: uuid.UUID) -> User:
         """Activate user account."""
-        user = await self.get_user(user_id)
-        user.is_active = True
-        updated_user = await self.user_repo.update(user)
+        updated_user = await self._patch_user(user_id, is_active=True)
+        
+        self.logger.info("User activated", user_id=user_id)
+        return updated_user
+    
+    async def _patch_user(self, user_id: uuid.UUID, **values: Any) -> User:
+        """Set columns on a user in a single update, without reading it first."""
+        updated_user = await self.user_repo.patch(user_id, **values)
+        if not updated_user:
+            raise NotFoundError(f"User with id {user_id} not found")
         
-        self.logger.info("User activated", user_id=str(user_id))
         return updated_user
     
     def get_user_profile(self, user: User) -> UserProfile:
         """Convert User to UserProfile."""
-        return UserProfile(
+        # The User is already validated, so skip re-validating every field
+        return UserProfile.model_construct(
             id=user.id,
             email=user.email,
             role=user.role,
@@ -118,33 +135,9 @@ class UserService:
     
     async def _validate_user_creation(self, user: User) -> None:
         """Validate user creation business rules."""
-        # Check if email already exists
-        existing_user = await self.user_repo.get_by_email(user.email)
-        if existing_user:
-            raise BusinessRuleError(
-                f"User with email {user.email} already exists",
-                code="DUPLICATE_EMAIL"
-            )
-        
         # Validate role
-        if user.role not in [UserRole.USER, UserRole.VENDOR, UserRole.ADMIN]:
+        if user.role not in _ALLOWED_ROLES:
             raise BusinessRuleError(
                 f"Invalid user role: {user.role}",
                 code="INVALID_ROLE"
             )
-    
-    async def _validate_user_update(self, user: User) -> None:
-        """Validate user update business rules."""
-        # Check if user exists
-        existing = await self.user_repo.get_by_id(user.id)
-        if not existing:
-            raise NotFoundError(f"User with id {user.id} not found")
-        
-        # Check if email is being changed and if it conflicts
-        if user.email != existing.email:
-            email_user = await self.user_repo.get_by_email(user.email)
-            if email_user and email_user.id != user.id:
-                raise BusinessRuleError(
-                    f"Email {user.email} is already in use",
-                    code="DUPLICATE_EMAIL"
-                )
@@ -1,22 +1,36 @@
 """Venue service for business logic."""
 
+import re
 import uuid
 from typing import List, Optional
 
-from domain.entities import Venue, VenueWithDetails
-from domain.enums import Province, VenueStatus
-from repositories.interfaces import VenueRepository
+from domain.entities import ProvinceRule, Venue, VenueWithDetails
+from domain.enums import SUPPORTED_PROVINCES, Province, VenueStatus
+from repositories.interfaces import ProvinceRuleRepository, VenueRepository
 from core.exceptions import BusinessRuleError, NotFoundError
-from core.logging import get_logger
+from core.logging import get_logger, profile_await
 
 logger = get_logger(__name__)
 
+_SUPPORTED_PROVINCES = frozenset(SUPPORTED_PROVINCES)
+
+# Slug generation: drop special characters, then collapse spaces/hyphens
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_DASH = re.compile(r'[-\s]+')
+# The same rules for ASCII names as one translate: drop special characters,
+# turn whitespace into hyphens
+_ASCII_SLUG_TABLE = str.maketrans({
+    chr(c): None if _SLUG_STRIP.match(chr(c)) else '-' if _SLUG_DASH.match(chr(c)) else chr(c)
+    for c in range(128)
+})
+
 
 class VenueService:
     """Service for venue business logic."""
     
-    def __init__(self, venue_repo: VenueRepository):
+    def __init__(self, venue_repo: VenueRepository, rule_repo: ProvinceRuleRepository):
         self.venue_repo = venue_repo
+        self.rule_repo = rule_repo
         self.logger = get_logger(self.__class__.__name__)
     
     async def create_venue(self, venue: Venue) -> Venue:
@@ -31,8 +45,15 @@ class VenueService:
         # Set default status
         venue.status = VenueStatus.PENDING
         
-        created_venue = await self.venue_repo.create(venue)
-        self.logger.info("Venue created", venue_id=str(created_venue.id), name=created_venue.name)
+        # Per-vendor name uniqueness is enforced by the insert itself
+        created_venue = await self.venue_repo.create_if_absent(venue)
+        if not created_venue:
+            raise BusinessRuleError(
+                f"Vendor already has a venue named '{venue.name}'",
+                code="DUPLICATE_VENUE_NAME"
+            )
+        
+        self.logger.info("Venue created", venue_id=created_venue.id, name=created_venue.name)
         
         return created_venue
     
@@ -58,7 +79,7 @@ class VenueService:
         await self._validate_venue_update(venue)
         
         updated_venue = await self.venue_repo.update(venue)
-        self.logger.info("Venue updated", venue_id=str(updated_venue.id))
+        self.logger.info("Venue updated", venue_id=updated_venue.id)
         
         return updated_venue
     
@@ -66,9 +87,9 @@ class VenueService:
         """Delete venue."""
         success = await self.venue_repo.delete(venue_id)
         if success:
-            self.logger.info("Venue deleted", venue_id=str(venue_id))
+            self.logger.info("Venue deleted", venue_id=venue_id)
         else:
-            self.logger.warning("Failed to delete venue", venue_id=str(venue_id))
+            self.logger.warning("Failed to delete venue", venue_id=venue_id)
         
         return success
     
@@ -76,6 +97,7 @@ class VenueService:
         """List venues by vendor."""
         return await self.venue_repo.list_by_vendor(vendor_id, limit, offset)
     
+    @profile_await
     async def search_nearby(
         self,
         lat: float,
@@ -87,6 +109,7 @@ class VenueService:
         """Search venues near coordinates."""
         return await self.venue_repo.search_nearby(lat, lng, radius_km, limit, offset)
     
+    @profile_await
     async def search_venues(
         self,
         query: Optional[str] = None,
@@ -99,58 +122,72 @@ class VenueService:
     ) -> List[VenueWithDetails]:
         """Search venues by filters."""
         return await self.venue_repo.search_by_filters(
-            query, city, province, license_type, status, limit, offset
+            query=query,
+            city=city,
+            province=province,
+            license_type=license_type,
+            status=status,
+            limit=limit,
+            offset=offset
         )
     
     async def activate_venue(self, venue_id: uuid.UUID) -> Venue:
         """Activate a venue."""
-        venue = await self.venue_repo.get_by_id(venue_id)
-        if not venue:
-            raise NotFoundError(f"Venue with id {venue_id} not found")
-        
-        venue.venue.activate()
-        updated_venue = await self.venue_repo.update(venue.venue)
+        updated_venue = await self._transition(venue_id, VenueStatus.ACTIVE)
         
-        self.logger.info("Venue activated", venue_id=str(venue_id))
+        self.logger.info("Venue activated", venue_id=venue_id)
         return updated_venue
     
     async def suspend_venue(self, venue_id: uuid.UUID) -> Venue:
         """Suspend a venue."""
-        venue = await self.venue_repo.get_by_id(venue_id)
-        if not venue:
-            raise NotFoundError(f"Venue with id {venue_id} not found")
-        
-        venue.venue.suspend()
-        updated_venue = await self.venue_repo.update(venue.venue)
+        updated_venue = await self._transition(venue_id, VenueStatus.SUSPENDED)
         
-        self.logger.info("Venue suspended", venue_id=str(venue_id))
+        self.logger.info("Venue suspended", venue_id=venue_id)
         return updated_venue
     
     async def verify_venue(self, venue_id: uuid.UUID) -> Venue:
         """Mark venue as verified."""
-        venue = await self.venue_repo.get_by_id(venue_id)
-        if not venue:
+        updated_venue = await self.venue_repo.verify(venue_id)
+        if not updated_venue:
             raise NotFoundError(f"Venue with id {venue_id} not found")
         
-        venue.venue.verify()
-        updated_venue = await self.venue_repo.update(venue.venue)
+        self.logger.info("Venue verified", venue_id=venue_id)
+        return updated_venue
+    
+    async def get_province_rule(self, province: Province) -> ProvinceRule:
+        """Get the compliance rule for a province.
+        
+        Served from the rule repository's per-process TTL cache, so the hot
+        read path doesn't query for rules on every request.
+        """
+        rule = await self.rule_repo.get_by_province(province.value)
+        if not rule:
+            raise NotFoundError(f"No rules found for province {province.value}")
+        
+        return rule
+    
+    async def update_province_rule(self, rule: ProvinceRule) -> ProvinceRule:
+        """Update a province rule (admin only).
+        
+        Cached rules are dropped once the update commits.
+        """
+        updated_rule = await self.rule_repo.update(rule)
+        
+        self.logger.info("Province rule updated", province=updated_rule.province.value)
+        return updated_rule
+    
+    async def _transition(self, venue_id: uuid.UUID, status: VenueStatus) -> Venue:
+        """Move a venue to a new status in a single update."""
+        updated_venue = await self.venue_repo.set_status(venue_id, status)
+        if not updated_venue:
+            raise NotFoundError(f"Venue with id {venue_id} not found")
         
-        self.logger.info("Venue verified", venue_id=str(venue_id))
         return updated_venue
     
     async def _validate_venue_creation(self, venue: Venue) -> None:
         """Validate venue creation business rules."""
-        # Check if vendor already has a venue with the same name
-        existing_venues = await self.venue_repo.list_by_vendor(venue.vendor_id, limit=1000)
-        for existing in existing_venues:
-            if existing.name.lower() == venue.name.lower():
-                raise BusinessRuleError(
-                    f"Vendor already has a venue named '{venue.name}'",
-                    code="DUPLICATE_VENUE_NAME"
-                )
-        
         # Validate province is supported
-        if venue.province not in [Province.ON, Province.BC, Province.AB]:
+        if venue.province not in _SUPPORTED_PROVINCES:
             raise BusinessRuleError(
                 f"Province {venue.province.value} is not yet supported",
                 code="UNSUPPORTED_PROVINCE"
@@ -159,18 +196,16 @@ class VenueService:
     async def _validate_venue_update(self, venue: Venue) -> None:
         """Validate venue update business rules."""
         # Check if venue exists
-        existing = await self.venue_repo.get_by_id(venue.id)
+        existing = await self.venue_repo.get_by_id_summary(venue.id)
         if not existing:
             raise NotFoundError(f"Venue with id {venue.id} not found")
     
     def _generate_slug(self, name: str) -> str:
         """Generate URL-friendly slug from venue name."""
-        import re
-        
-        # Convert to lowercase and replace spaces with hyphens
-        slug = name.lower()
-        slug = re.sub(r'[^\w\s-]', '', slug)  # Remove special characters
-        slug = re.sub(r'[-\s]+', '-', slug)   # Replace spaces and multiple hyphens
-        slug = slug.strip('-')                # Remove leading/trailing hyphens
+        if name.isascii():
+            # Splitting on hyphens collapses runs and trims the ends
+            return '-'.join(filter(None, name.lower().translate(_ASCII_SLUG_TABLE).split('-')))
         
-        return slug
+        slug = _SLUG_STRIP.sub('', name.lower())  # Remove special characters
+        slug = _SLUG_DASH.sub('-', slug)          # Replace spaces and multiple hyphens
+        return slug.strip('-')                    # Remove leading/trailing hyphens
@@ -0,0 +1,62 @@
+"""Shared test fixtures."""
+
+import uuid
+from typing import Any, Callable
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from domain.entities import Deal, Flag, User, Venue
+from domain.enums import DealCategory, FlagReason, LicenseType, Province
+
+
+@pytest.fixture
+def db() -> AsyncMock:
+    """A session whose statements match no rows."""
+    session = AsyncMock()
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = None
+    result.all.return_value = []
+    session.execute.return_value = result
+    return session
+
+
+@pytest.fixture
+def last_statement(db: AsyncMock) -> Callable[[], Any]:
+    """Compile (for PostgreSQL) the last statement executed on ``db``."""
+    def compile_last() -> Any:
+        return db.execute.call_args.args[0].compile(dialect=postgresql.dialect())
+    return compile_last
+
+
+@pytest.fixture
+def user() -> User:
+    return User(email="user@example.com")
+
+
+@pytest.fixture
+def venue() -> Venue:
+    return Venue(
+        name="The Local Pub",
+        address="123 Queen St W",
+        city="Toronto",
+        province=Province.ON,
+        license_type=LicenseType.PUB,
+        vendor_id=uuid.uuid4(),
+    )
+
+
+@pytest.fixture
+def deal() -> Deal:
+    return Deal(venue_id=uuid.uuid4(), title="Half Price Wings", category=DealCategory.FOOD)
+
+
+@pytest.fixture
+def flag() -> Flag:
+    return Flag(
+        target_type="DEAL",
+        target_id=uuid.uuid4(),
+        reason=FlagReason.OUTDATED_INFO,
+        user_id=uuid.uuid4(),
+    )
@@ -0,0 +1,125 @@
+"""Tests for analytics summary cache invalidation."""
+
+import asyncio
+import uuid
+from datetime import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from domain.entities import AnalyticsSummary, EventLog
+from domain.enums import EventType
+from services import analytics_service
+from services.analytics_service import AnalyticsService
+from services.event_sink import EventLogSink
+
+_cache = analytics_service._summary_cache
+WINDOW = (datetime(2024, 1, 1), datetime(2024, 1, 31))
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    _cache.clear()
+    yield
+    _cache.clear()
+
+
+def _cache_summary(target_id: uuid.UUID) -> None:
+    summary = AnalyticsSummary(
+        target_id=target_id,
+        target_type="VENUE",
+        period_start=WINDOW[0],
+        period_end=WINDOW[1],
+    )
+    _cache.set(("VENUE", target_id), {WINDOW: summary})
+
+
+async def test_buffered_event_drops_summary_once_written():
+    target_id = uuid.uuid4()
+    written = asyncio.Event()
+    release = asyncio.Event()
+    
+    async def flush(events):
+        await release.wait()
+        written.set()
+    
+    sink = EventLogSink(flush=flush, max_rows=1)
+    service = AnalyticsService(AsyncMock(), event_sink=sink)
+    
+    await service.track_impression("VENUE", target_id)
+    # A summary recomputed while the event is still buffered...
+    _cache_summary(target_id)
+    await asyncio.sleep(0)
+    assert _cache.get(("VENUE", target_id)) is not None
+    
+    # ...is dropped once the sink has written it
+    release.set()
+    await sink.aclose()
+    assert written.is_set()
+    assert _cache.get(("VENUE", target_id)) is None
+
+
+async def test_failed_flush_keeps_summary():
+    target_id = uuid.uuid4()
+    
+    async def flush(events):
+        raise RuntimeError("database unavailable")
+    
+    sink = EventLogSink(flush=flush, max_rows=1)
+    service = AnalyticsService(AsyncMock(), event_sink=sink)
+    
+    await service.track_impression("VENUE", target_id)
+    _cache_summary(target_id)
+    await sink.aclose()
+    assert _cache.get(("VENUE", target_id)) is not None
+
+
+async def test_inline_write_drops_summary():
+    target_id = uuid.uuid4()
+    _cache_summary(target_id)
+    event_repo = AsyncMock()
+    service = AnalyticsService(event_repo, event_sink=None)
+    
+    await service.track_event(EventType.SAVE, "VENUE", target_id, user_id=uuid.uuid4())
+    
+    event_repo.create.assert_awaited_once()
+    assert _cache.get(("VENUE", target_id)) is None
+
+
+async def test_telemetry_batch_is_written_outside_the_request_session(monkeypatch):
+    written = []
+    
+    async def write_events(events):
+        written.append(events)
+    
+    monkeypatch.setattr(analytics_service, "write_events", write_events)
+    event_repo = AsyncMock()
+    service = AnalyticsService(event_repo, event_sink=None)
+    events = [
+        EventLog(type=EventType.IMPRESSION, target_type="VENUE", target_id=uuid.uuid4())
+    ]
+    
+    assert await service.track_events_batch(events) == events
+    
+    assert written == [events]
+    event_repo.create_batch.assert_not_awaited()
+    event_repo.relaxed_durability.assert_not_called()
+
+
+async def test_durable_batch_is_written_in_the_request_session(monkeypatch):
+    monkeypatch.setattr(analytics_service, "write_events", AsyncMock())
+    event_repo = AsyncMock()
+    service = AnalyticsService(event_repo, event_sink=None)
+    events = [
+        EventLog(
+            type=EventType.SAVE,
+            target_type="VENUE",
+            target_id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+        )
+    ]
+    
+    await service.track_events_batch(events)
+    
+    event_repo.create_batch.assert_awaited_once_with(events)
+    analytics_service.write_events.assert_not_awaited()
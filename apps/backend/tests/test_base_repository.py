@@ -0,0 +1,28 @@
+"""Tests for behaviour shared by all repositories."""
+
+from datetime import datetime
+
+import pytest
+
+from repositories.deal_repository import DealRepositoryImpl
+from repositories.user_repository import UserRepositoryImpl
+
+STALE = datetime(2020, 1, 1)
+
+
+@pytest.mark.parametrize(
+    "repo_class, entity",
+    [(DealRepositoryImpl, "deal"), (UserRepositoryImpl, "user")],
+)
+async def test_update_does_not_write_back_stale_updated_at(
+    repo_class, entity, db, last_statement, request
+):
+    entity = request.getfixturevalue(entity)
+    entity.updated_at = STALE
+    
+    assert await repo_class(db).update(entity) is None
+    
+    params = last_statement().params
+    # Left to the column's onupdate, filled in at execution
+    assert "updated_at" in params
+    assert params["updated_at"] != STALE
@@ -0,0 +1,7 @@
+"""Tests for the deal repository."""
+
+from repositories.deal_repository import DealRepositoryImpl
+
+
+async def test_update_missing_deal_returns_none(db, deal):
+    assert await DealRepositoryImpl(db).update(deal) is None
@@ -0,0 +1,85 @@
+"""Tests for inserts that skip duplicates (INSERT ... ON CONFLICT DO NOTHING)."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core.exceptions import BusinessRuleError
+from repositories.flag_repository import FlagRepositoryImpl
+from repositories.user_repository import UserRepositoryImpl
+from repositories.venue_repository import VenueRepositoryImpl
+from services.moderation_service import ModerationService
+from services.user_service import UserService
+from services.venue_service import VenueService
+
+
+@pytest.mark.parametrize(
+    "repo_class, entity, conflict_clause",
+    [
+        (UserRepositoryImpl, "user", "ON CONFLICT (email)"),
+        (VenueRepositoryImpl, "venue", "ON CONFLICT (vendor_id, lower(name))"),
+        (
+            FlagRepositoryImpl,
+            "flag",
+            "ON CONFLICT (user_id, target_type, target_id) WHERE status = 'PENDING'",
+        ),
+    ],
+)
+async def test_create_if_absent_returns_none_on_conflict(
+    repo_class, entity, conflict_clause, db, last_statement, request
+):
+    entity = request.getfixturevalue(entity)
+    
+    assert await repo_class(db).create_if_absent(entity) is None
+    
+    assert f"{conflict_clause} DO NOTHING RETURNING" in str(last_statement())
+
+
+# (entity fixture, service factory, create call, error code on duplicate)
+SERVICE_CASES = [
+    pytest.param(
+        "user",
+        lambda repo: UserService(repo),
+        lambda service, user: service.create_user(user),
+        "DUPLICATE_EMAIL",
+        id="user",
+    ),
+    pytest.param(
+        "venue",
+        lambda repo: VenueService(repo, AsyncMock()),
+        lambda service, venue: service.create_venue(venue),
+        "DUPLICATE_VENUE_NAME",
+        id="venue",
+    ),
+    pytest.param(
+        "flag",
+        lambda repo: ModerationService(repo, AsyncMock()),
+        lambda service, flag: service.create_flag(
+            flag.target_type, flag.target_id, flag.reason, flag.description, flag.user_id
+        ),
+        "DUPLICATE_FLAG",
+        id="flag",
+    ),
+]
+
+
+@pytest.mark.parametrize("entity, make_service, create, code", SERVICE_CASES)
+async def test_duplicate_raises_business_rule_error(
+    entity, make_service, create, code, request
+):
+    entity = request.getfixturevalue(entity)
+    repo = AsyncMock()
+    repo.create_if_absent.return_value = None
+    
+    with pytest.raises(BusinessRuleError) as exc_info:
+        await create(make_service(repo), entity)
+    assert exc_info.value.code == code
+
+
+@pytest.mark.parametrize("entity, make_service, create, code", SERVICE_CASES)
+async def test_created_entity_is_returned(entity, make_service, create, code, request):
+    entity = request.getfixturevalue(entity)
+    repo = AsyncMock()
+    repo.create_if_absent.return_value = entity
+    
+    assert await create(make_service(repo), entity) is entity
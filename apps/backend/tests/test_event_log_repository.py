@@ -0,0 +1,55 @@
+"""Tests for event log batch writes."""
+
+import uuid
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from domain.entities import EventLog
+from domain.enums import EventType
+from repositories.event_log_repository import COPY_MIN_ROWS, EventLogRepositoryImpl
+
+
+def _events(count: int) -> list:
+    return [
+        EventLog(type=EventType.IMPRESSION, target_type="VENUE", target_id=uuid.uuid4())
+        for _ in range(count)
+    ]
+
+
+def _db() -> AsyncMock:
+    """A session whose raw connection records COPY calls."""
+    db = AsyncMock()
+    raw = MagicMock()
+    raw.driver_connection.copy_records_to_table = AsyncMock()
+    conn = AsyncMock()
+    conn.get_raw_connection.return_value = raw
+    db.connection.return_value = conn
+    return db
+
+
+async def test_small_batch_inserts_without_ids():
+    db = _db()
+    events = _events(3)
+    
+    assert await EventLogRepositoryImpl(db).create_batch(events) is events
+    
+    insert_stmt = db.execute.call_args_list[0].args[0]
+    sql = str(insert_stmt.compile(dialect=postgresql.dialect()))
+    assert sql.startswith("INSERT INTO event_logs (user_id, type,")
+    db.connection.assert_not_awaited()
+
+
+async def test_large_batch_copies_without_ids():
+    db = _db()
+    events = _events(COPY_MIN_ROWS)
+    
+    await EventLogRepositoryImpl(db).create_batch(events)
+    
+    copy = db.connection.return_value.get_raw_connection.return_value.driver_connection
+    kwargs = copy.copy_records_to_table.call_args.kwargs
+    assert "id" not in kwargs["columns"]
+    assert len(kwargs["records"]) == COPY_MIN_ROWS
+    assert all(len(record) == len(kwargs["columns"]) for record in kwargs["records"])
+    # Only the rollup statement goes through execute
+    assert db.execute.await_count == 1
@@ -0,0 +1,159 @@
+"""Tests for the buffered event log sink."""
+
+import asyncio
+import uuid
+from typing import List
+
+from domain.entities import EventLog
+from domain.enums import EventType
+from services import event_sink
+from services.event_sink import EventLogSink
+
+
+def _event(event_type: EventType = EventType.IMPRESSION) -> EventLog:
+    return EventLog(type=event_type, target_type="VENUE", target_id=uuid.uuid4())
+
+
+class Recorder:
+    """Flush function recording the batches it was given."""
+    
+    def __init__(self) -> None:
+        self.batches: List[List[EventLog]] = []
+        self.flushed = asyncio.Event()
+    
+    async def __call__(self, events: List[EventLog]) -> None:
+        self.batches.append(list(events))
+        self.flushed.set()
+    
+    @property
+    def events(self) -> List[EventLog]:
+        return [event for batch in self.batches for event in batch]
+
+
+async def _drained(sink: EventLogSink) -> None:
+    """Wait until the flusher has taken every buffered event."""
+    while sink._head != sink._tail:
+        await asyncio.sleep(0.001)
+
+
+async def test_events_are_written_in_order_across_ring_wraparound():
+    recorder = Recorder()
+    sink = EventLogSink(flush=recorder, max_rows=3, flush_interval_ms=1, capacity=4)
+    submitted = []
+    
+    for _ in range(5):
+        for _ in range(3):
+            event = _event()
+            assert sink.submit(event)
+            submitted.append(event)
+        await asyncio.wait_for(_drained(sink), timeout=1)
+    await sink.aclose()
+    
+    assert sink._tail == 15 > sink.capacity
+    assert sink._head == sink._tail
+    assert recorder.events == submitted
+    assert all(slot is None for slot in sink._slots)
+
+
+async def test_submit_rejects_events_when_full():
+    recorder = Recorder()
+    sink = EventLogSink(flush=recorder, max_rows=10, capacity=2)
+    
+    assert sink.submit(_event())
+    assert sink.submit(_event())
+    # The flusher hasn't run yet, so the ring is still full
+    assert not sink.submit(_event())
+    
+    await sink.aclose()
+    assert len(recorder.events) == 2
+
+
+async def test_full_batch_wakes_flusher_before_interval():
+    recorder = Recorder()
+    sink = EventLogSink(flush=recorder, max_rows=3, flush_interval_ms=60_000)
+    
+    for _ in range(3):
+        sink.submit(_event())
+    await asyncio.wait_for(recorder.flushed.wait(), timeout=1)
+    
+    assert [len(batch) for batch in recorder.batches] == [3]
+    await sink.aclose()
+
+
+async def test_partial_batch_is_flushed_after_interval():
+    recorder = Recorder()
+    sink = EventLogSink(flush=recorder, max_rows=100, flush_interval_ms=20)
+    
+    sink.submit(_event())
+    await asyncio.sleep(0)
+    assert not recorder.batches
+    
+    await asyncio.wait_for(recorder.flushed.wait(), timeout=1)
+    assert [len(batch) for batch in recorder.batches] == [1]
+    await sink.aclose()
+
+
+async def test_aclose_flushes_pending_events_and_rejects_new_ones():
+    recorder = Recorder()
+    sink = EventLogSink(flush=recorder, max_rows=100, flush_interval_ms=60_000)
+    events = [_event() for _ in range(5)]
+    for event in events:
+        sink.submit(event)
+    
+    await asyncio.wait_for(sink.aclose(), timeout=1)
+    
+    assert recorder.events == events
+    assert not sink.submit(_event())
+
+
+async def test_batch_is_written_in_groups_by_event_type():
+    recorder = Recorder()
+    sink = EventLogSink(flush=recorder, max_rows=4, flush_interval_ms=60_000)
+    
+    sink.submit(_event(EventType.IMPRESSION))
+    sink.submit(_event(EventType.CLICK))
+    sink.submit(_event(EventType.IMPRESSION))
+    sink.submit(_event(EventType.CLICK))
+    await sink.aclose()
+    
+    assert sorted(
+        [event.type for event in batch] for batch in recorder.batches
+    ) == sorted([[EventType.IMPRESSION] * 2, [EventType.CLICK] * 2])
+
+
+async def test_failed_flush_does_not_stop_the_sink():
+    written = []
+    
+    async def flush(events: List[EventLog]) -> None:
+        if not written:
+            written.append(None)
+            raise RuntimeError("database unavailable")
+        written.extend(events)
+    
+    sink = EventLogSink(flush=flush, max_rows=1, flush_interval_ms=1)
+    sink.submit(_event())
+    await asyncio.wait_for(_drained(sink), timeout=1)
+    event = _event()
+    sink.submit(event)
+    await sink.aclose()
+    
+    assert written[1:] == [event]
+
+
+async def test_failed_listener_does_not_stop_the_sink(monkeypatch):
+    def listener(events: List[EventLog]) -> None:
+        raise RuntimeError("listener bug")
+    
+    monkeypatch.setattr(event_sink, "_written_listeners", [listener])
+    recorder = Recorder()
+    sink = EventLogSink(flush=recorder, max_rows=1, flush_interval_ms=1)
+    
+    sink.submit(_event())
+    await asyncio.wait_for(_drained(sink), timeout=1)
+    await asyncio.wait_for(recorder.flushed.wait(), timeout=1)
+    assert not sink._task.done()
+    
+    event = _event()
+    assert sink.submit(event)
+    await sink.aclose()
+    assert recorder.events[-1] is event
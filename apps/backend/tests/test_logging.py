@@ -0,0 +1,34 @@
+"""Tests for logging setup."""
+
+import logging
+from logging.handlers import QueueHandler
+
+import pytest
+
+from core.logging import setup_logging, shutdown_logging
+
+
+@pytest.fixture
+def root_handlers():
+    """Restore the root logger's handlers and level after the test."""
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield root
+    shutdown_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def test_setup_logging_replaces_existing_root_handlers(root_handlers, capsys):
+    existing = logging.StreamHandler()
+    root_handlers.addHandler(existing)
+    
+    setup_logging()
+    setup_logging()
+    
+    assert existing not in root_handlers.handlers
+    assert [type(h) for h in root_handlers.handlers] == [QueueHandler]
+    
+    logging.getLogger("test").warning("still logged")
+    shutdown_logging()
+    assert "still logged" in capsys.readouterr().out
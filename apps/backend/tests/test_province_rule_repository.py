@@ -0,0 +1,71 @@
+"""Tests for province rule caching."""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities import ProvinceRule
+from domain.enums import Province
+from repositories import province_rule_repository
+from repositories.province_rule_repository import ProvinceRuleRepositoryImpl
+
+_cache = province_rule_repository._rules_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    _cache.clear()
+    yield
+    _cache.clear()
+
+
+def _cached_rule() -> ProvinceRule:
+    rule = ProvinceRule(province=Province.ON, min_age=19)
+    _cache.set(Province.ON.value, rule)
+    return rule
+
+
+def test_write_keeps_cache_until_commit():
+    session = AsyncSession()
+    repo = ProvinceRuleRepositoryImpl(session)
+    _cached_rule()
+    
+    repo._invalidate_on_commit()
+    assert len(_cache) == 1
+    assert repo._wrote_rules()
+    
+    session.sync_session.dispatch.after_commit(session.sync_session)
+    assert len(_cache) == 0
+    assert not repo._wrote_rules()
+
+
+def test_rolled_back_write_leaves_cache():
+    session = AsyncSession()
+    repo = ProvinceRuleRepositoryImpl(session)
+    _cached_rule()
+    
+    repo._invalidate_on_commit()
+    session.sync_session.dispatch.after_rollback(session.sync_session)
+    assert len(_cache) == 1
+    assert not repo._wrote_rules()
+    
+    # A later commit without rule writes leaves the cache alone
+    session.sync_session.dispatch.after_commit(session.sync_session)
+    assert len(_cache) == 1
+
+
+async def test_session_that_wrote_rules_reads_around_cache(monkeypatch):
+    session = AsyncSession()
+    repo = ProvinceRuleRepositoryImpl(session)
+    _cached_rule()
+    repo._invalidate_on_commit()
+    
+    executed = []
+    
+    async def execute(stmt):
+        executed.append(stmt)
+        raise RuntimeError("queried")
+    
+    monkeypatch.setattr(session, "execute", execute)
+    with pytest.raises(RuntimeError, match="queried"):
+        await repo.get_by_province(Province.ON.value)
+    assert executed
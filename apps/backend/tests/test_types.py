@@ -0,0 +1,54 @@
+"""Tests for custom column types."""
+
+import pytest
+from sqlalchemy import literal, select
+from sqlalchemy.dialects import postgresql
+
+from domain.enums import DayOfWeek, DealCategory
+from repositories.types import IntEnumType
+
+_dialect = postgresql.dialect()
+
+
+def test_codes_follow_definition_order():
+    enum_type = IntEnumType(DealCategory)
+    
+    assert [enum_type.code_of(member) for member in DealCategory] == [1, 2, 3, 4]
+
+
+@pytest.mark.parametrize("member", list(DayOfWeek))
+def test_round_trip(member):
+    enum_type = IntEnumType(DayOfWeek)
+    
+    code = enum_type.process_bind_param(member, _dialect)
+    assert enum_type.process_result_value(code, _dialect) is member
+
+
+def test_binds_enum_values():
+    enum_type = IntEnumType(DealCategory)
+    
+    assert enum_type.process_bind_param("drink", _dialect) == 2
+
+
+def test_none_round_trips():
+    enum_type = IntEnumType(DealCategory)
+    
+    assert enum_type.process_bind_param(None, _dialect) is None
+    assert enum_type.process_result_value(None, _dialect) is None
+
+
+def test_literal_rendering():
+    stmt = select(literal(DealCategory.EVENT, IntEnumType(DealCategory)))
+    
+    sql = str(stmt.compile(dialect=_dialect, compile_kwargs={"literal_binds": True}))
+    assert sql == "SELECT 4 AS anon_1"
+
+
+def test_unknown_value_is_rejected():
+    with pytest.raises(ValueError):
+        IntEnumType(DealCategory).process_bind_param("brunch", _dialect)
+
+
+def test_unknown_code_is_rejected():
+    with pytest.raises(KeyError):
+        IntEnumType(DealCategory).process_result_value(99, _dialect)
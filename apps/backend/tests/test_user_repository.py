@@ -0,0 +1,42 @@
+"""Tests for the user repository."""
+
+import uuid
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from core.exceptions import BusinessRuleError
+from repositories.user_repository import EMAIL_INDEX, UserRepositoryImpl
+
+
+def _integrity_error(constraint_name: str) -> IntegrityError:
+    """An IntegrityError as raised through the asyncpg adapter."""
+    cause = Exception("duplicate key value violates unique constraint")
+    cause.constraint_name = constraint_name
+    orig = Exception()
+    orig.__cause__ = cause
+    return IntegrityError("UPDATE users ...", {}, orig)
+
+
+async def test_update_with_taken_email_raises_duplicate_email(db, user):
+    db.execute.side_effect = _integrity_error(EMAIL_INDEX)
+    
+    with pytest.raises(BusinessRuleError) as exc_info:
+        await UserRepositoryImpl(db).update(user)
+    assert exc_info.value.code == "DUPLICATE_EMAIL"
+
+
+async def test_update_reraises_other_integrity_errors(db, user):
+    db.execute.side_effect = _integrity_error("some_other_constraint")
+    
+    with pytest.raises(IntegrityError):
+        await UserRepositoryImpl(db).update(user)
+
+
+async def test_touch_last_login_uses_database_time(db, last_statement):
+    assert await UserRepositoryImpl(db).touch_last_login(uuid.uuid4()) is None
+    
+    sql = str(last_statement())
+    assert "last_login_at=timezone(" in sql
+    assert "now()" in sql
+
@@ -0,0 +1,18 @@
+"""Tests for the user service."""
+
+import uuid
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core.exceptions import NotFoundError
+from services.user_service import UserService
+
+
+async def test_update_missing_user_raises_not_found(user):
+    user_repo = AsyncMock()
+    user_repo.update.return_value = None
+    user.id = uuid.uuid4()
+    
+    with pytest.raises(NotFoundError):
+        await UserService(user_repo).update_user(user)
@@ -0,0 +1,58 @@
+"""Tests for the venue repository."""
+
+import uuid
+from unittest.mock import AsyncMock
+
+from geoalchemy2.shape import from_shape
+from shapely.geometry import Point
+
+from domain.enums import LicenseType, Province, VenueStatus
+from repositories.models import Venue as VenueModel
+from repositories.venue_repository import VenueRepositoryImpl, h3_cell
+
+LAT, LNG = 43.6532, -79.3832
+
+
+def _stored_venue() -> VenueModel:
+    """A venue row as loaded from the database, geo still in WKB form."""
+    return VenueModel(
+        id=uuid.uuid4(),
+        vendor_id=uuid.uuid4(),
+        name="The Local Pub",
+        slug="the-local-pub",
+        address="123 Queen St W",
+        city="Toronto",
+        province=Province.ON,
+        geo=from_shape(Point(LNG, LAT), srid=4326),
+        h3_res9=h3_cell(LAT, LNG),
+        license_type=LicenseType.BAR,
+        status=VenueStatus.ACTIVE,
+    )
+
+
+async def test_update_of_stored_venue_keeps_h3_cell():
+    db_obj = _stored_venue()
+    db = AsyncMock()
+    db.get.return_value = db_obj
+    repo = VenueRepositoryImpl(db)
+    
+    venue = repo._model_to_entity(db_obj)
+    venue.name = "The Local Pub & Grill"
+    await repo.update(venue)
+    
+    assert db_obj.h3_res9 == h3_cell(LAT, LNG)
+
+
+def test_model_values_computes_h3_cell_for_point():
+    repo = VenueRepositoryImpl(AsyncMock())
+    venue = repo._model_to_entity(_stored_venue())
+    venue.geo = Point(LNG, LAT)
+    
+    assert repo._model_values(venue)["h3_res9"] == h3_cell(LAT, LNG)
+
+
+async def test_small_radius_search_keeps_venues_without_h3_cell(db, last_statement):
+    assert await VenueRepositoryImpl(db).search_nearby(LAT, LNG, radius_km=1.0) == []
+    
+    sql = str(last_statement())
+    assert "venues.h3_res9 IS NULL OR venues.h3_res9 = ANY (" in sql
@@ -0,0 +1,14 @@
+"""Tests for the venue service."""
+
+from unittest.mock import AsyncMock
+
+from services.venue_service import VenueService
+
+
+async def test_create_venue_generates_slug(venue):
+    venue_repo = AsyncMock()
+    venue_repo.create_if_absent.side_effect = lambda venue: venue
+    service = VenueService(venue_repo, AsyncMock())
+    
+    created = await service.create_venue(venue)
+    assert created.slug == "the-local-pub"
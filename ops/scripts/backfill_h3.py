@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""Backfill Venue.h3_res9 for venues written before the column existed."""
+
+import asyncio
+
+from sqlalchemy import func, select, update
+
+from core import database
+from core.database import init_database
+from repositories.models import Venue
+from repositories.venue_repository import h3_cell
+
+# Venues updated per statement
+BATCH_SIZE = 1000
+
+
+async def backfill_h3_cells() -> int:
+    """Set h3_res9 on every located venue missing it. Returns the number updated."""
+    total = 0
+    
+    # Read the factory through the module: init_database rebinds it
+    async with database.async_session_factory() as session:
+        while True:
+            # Each batch commits on its own, so a rerun picks up where this stopped
+            async with session.begin():
+                result = await session.execute(
+                    select(Venue.id, func.ST_Y(Venue.geo), func.ST_X(Venue.geo))
+                    .where(Venue.h3_res9.is_(None), Venue.geo.isnot(None))
+                    .limit(BATCH_SIZE)
+                )
+                rows = [
+                    {"id": venue_id, "h3_res9": h3_cell(lat, lng)}
+                    for venue_id, lat, lng in result
+                ]
+                if not rows:
+                    break
+                
+                # ORM bulk UPDATE by primary key: one executemany per batch
+                await session.execute(update(Venue), rows)
+            
+            total += len(rows)
+            print(f"Backfilled {total} venues")
+    
+    return total
+
+
+async def main():
+    """Main backfill function."""
+    await init_database()
+    total = await backfill_h3_cells()
+    print(f"✅ H3 backfill completed: {total} venues updated")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
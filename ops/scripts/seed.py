@@ -2,18 +2,39 @@
 """Seed script for loading sample data into the database."""
 
 import asyncio
+import struct
 import uuid
+from collections import defaultdict
 from datetime import datetime, time
-from typing import List
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
 
+from geoalchemy2 import WKBElement
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.database import init_database, async_session_factory
+from core import database
+from core.database import init_database
+from domain.entities import DAY_BITS
 from domain.enums import (
     DayOfWeek, DealCategory, LicenseType, Province, 
     SecondaryHoursType, UserRole, VenueStatus
 )
 from repositories.models import User, Venue, Hours, SecondaryHours, Deal, ProvinceRule
+from repositories.venue_repository import h3_cell
+
+
+def _point_ewkb(lng: float, lat: float) -> bytes:
+    """Encode an SRID 4326 point as little-endian EWKB."""
+    # byte order, geometry type (1 = Point) with the SRID flag, SRID, x, y
+    return struct.pack("<BIIdd", 1, 1 | 0x20000000, 4326, lng, lat)
+
+
+def _days_mask(*days: DayOfWeek) -> int:
+    """Build a Deal.days_mask from weekdays."""
+    mask = 0
+    for day in days:
+        mask |= DAY_BITS[day]
+    return mask
 
 
 # Sample data
@@ -124,6 +145,13 @@ SAMPLE_VENUES = [
     },
 ]
 
+# Swap each venue's lat/lng for its geo (as EWKB, which PostGIS reads without
+# parsing WKT) and H3 cell, once at import
+for _venue in SAMPLE_VENUES:
+    _lat, _lng = _venue.pop("lat"), _venue.pop("lng")
+    _venue["geo"] = WKBElement(_point_ewkb(_lng, _lat), srid=4326, extended=True)
+    _venue["h3_res9"] = h3_cell(_lat, _lng)
+
 SAMPLE_DEALS = [
     {
         "title": "$5 Wings & $4 Beer",
@@ -131,7 +159,7 @@ SAMPLE_DEALS = [
         "category": DealCategory.FOOD,
         "original_price": 13.00,
         "deal_price": 9.00,
-        "days_mask": 0b0111000,  # Mon, Tue, Wed
+        "days_mask": _days_mask(DayOfWeek.MONDAY, DayOfWeek.TUESDAY, DayOfWeek.WEDNESDAY),
         "start_time": time(15, 0),
         "end_time": time(18, 0),
         "restrictions": "Dine-in only",
@@ -145,7 +173,10 @@ SAMPLE_DEALS = [
         "category": DealCategory.DRINK,
         "original_price": 14.00,
         "deal_price": 7.00,
-        "days_mask": 0b1111100,  # Mon-Fri
+        "days_mask": _days_mask(
+            DayOfWeek.MONDAY, DayOfWeek.TUESDAY, DayOfWeek.WEDNESDAY,
+            DayOfWeek.THURSDAY, DayOfWeek.FRIDAY
+        ),
         "start_time": time(17, 0),
         "end_time": time(19, 0),
         "restrictions": "Bar seating only",
@@ -159,7 +190,7 @@ SAMPLE_DEALS = [
         "category": DealCategory.FOOD,
         "original_price": 12.00,
         "deal_price": 12.00,
-        "days_mask": 0b0001110,  # Wed, Thu, Fri
+        "days_mask": _days_mask(DayOfWeek.WEDNESDAY, DayOfWeek.THURSDAY, DayOfWeek.FRIDAY),
         "start_time": time(16, 0),
         "end_time": time(18, 30),
         "is_active": True,
@@ -169,85 +200,79 @@ SAMPLE_DEALS = [
 ]
 
 
-async def create_users(session: AsyncSession) -> List[User]:
-    """Create sample users."""
+async def create_users(session: AsyncSession) -> Tuple[List[User], Dict[UserRole, List[User]]]:
+    """Create sample users, returning them and the same users grouped by role."""
+    # Bulk insert, reading the rows (with IDs) back via RETURNING
+    result = await session.execute(
+        insert(User).returning(User, sort_by_parameter_order=True), SAMPLE_USERS
+    )
     users = []
-    for user_data in SAMPLE_USERS:
-        user = User(**user_data)
-        session.add(user)
+    by_role: Dict[UserRole, List[User]] = defaultdict(list)
+    for user in result.scalars():
         users.append(user)
+        by_role[user.role].append(user)
     
-    await session.commit()
     print(f"Created {len(users)} users")
-    return users
+    return users, by_role
 
 
 async def create_venues(session: AsyncSession, vendor: User) -> List[Venue]:
     """Create sample venues."""
-    venues = []
-    for venue_data in SAMPLE_VENUES:
-        # Extract lat/lng for PostGIS
-        lat = venue_data.pop("lat")
-        lng = venue_data.pop("lng")
-        
-        venue = Venue(
-            **venue_data,
-            vendor_id=vendor.id,
-            # geo=f"POINT({lng} {lat})"  # PostGIS format
-        )
-        session.add(venue)
-        venues.append(venue)
-    
-    await session.commit()
+    result = await session.execute(
+        insert(Venue).returning(Venue, sort_by_parameter_order=True),
+        [{**venue_data, "vendor_id": vendor.id} for venue_data in SAMPLE_VENUES],
+    )
+    venues = list(result.scalars())
     print(f"Created {len(venues)} venues")
     return venues
 
 
 async def create_hours(session: AsyncSession, venues: List[Venue]) -> None:
     """Create operating hours for venues."""
-    hours_count = 0
+    # Regular hours (Mon-Thu: 11am-12am, Fri-Sat: 11am-2am, Sun: 12pm-11pm)
+    regular_hours = [
+        (DayOfWeek.MONDAY, time(11, 0), time(0, 0)),
+        (DayOfWeek.TUESDAY, time(11, 0), time(0, 0)),
+        (DayOfWeek.WEDNESDAY, time(11, 0), time(0, 0)),
+        (DayOfWeek.THURSDAY, time(11, 0), time(0, 0)),
+        (DayOfWeek.FRIDAY, time(11, 0), time(2, 0)),
+        (DayOfWeek.SATURDAY, time(11, 0), time(2, 0)),
+        (DayOfWeek.SUNDAY, time(12, 0), time(23, 0)),
+    ]
     
-    for venue in venues:
-        # Regular hours (Mon-Thu: 11am-12am, Fri-Sat: 11am-2am, Sun: 12pm-11pm)
-        regular_hours = [
-            (DayOfWeek.MONDAY, time(11, 0), time(0, 0)),
-            (DayOfWeek.TUESDAY, time(11, 0), time(0, 0)),
-            (DayOfWeek.WEDNESDAY, time(11, 0), time(0, 0)),
-            (DayOfWeek.THURSDAY, time(11, 0), time(0, 0)),
-            (DayOfWeek.FRIDAY, time(11, 0), time(2, 0)),
-            (DayOfWeek.SATURDAY, time(11, 0), time(2, 0)),
-            (DayOfWeek.SUNDAY, time(12, 0), time(23, 0)),
-        ]
-        
-        for day, open_time, close_time in regular_hours:
-            hours = Hours(
-                venue_id=venue.id,
-                day=day,
-                open_time=open_time,
-                close_time=close_time,
-            )
-            session.add(hours)
-            hours_count += 1
-        
-        # Happy hour (Mon-Fri: 3pm-6pm)
-        for day in [DayOfWeek.MONDAY, DayOfWeek.TUESDAY, DayOfWeek.WEDNESDAY, DayOfWeek.THURSDAY, DayOfWeek.FRIDAY]:
-            happy_hour = SecondaryHours(
-                venue_id=venue.id,
-                type=SecondaryHoursType.HAPPY_HOUR,
-                day=day,
-                start_time=time(15, 0),
-                end_time=time(18, 0),
-            )
-            session.add(happy_hour)
-            hours_count += 1
+    # Bulk inserts: one executemany per table, no ORM objects
+    hours_rows = [
+        {
+            "venue_id": venue.id,
+            "day": day,
+            "open_time": open_time,
+            "close_time": close_time,
+        }
+        for venue in venues
+        for day, open_time, close_time in regular_hours
+    ]
+    await session.execute(insert(Hours), hours_rows)
+    
+    # Happy hour (Mon-Fri: 3pm-6pm)
+    happy_hour_rows = [
+        {
+            "venue_id": venue.id,
+            "type": SecondaryHoursType.HAPPY_HOUR,
+            "day": day,
+            "start_time": time(15, 0),
+            "end_time": time(18, 0),
+        }
+        for venue in venues
+        for day in [DayOfWeek.MONDAY, DayOfWeek.TUESDAY, DayOfWeek.WEDNESDAY, DayOfWeek.THURSDAY, DayOfWeek.FRIDAY]
+    ]
+    await session.execute(insert(SecondaryHours), happy_hour_rows)
     
-    await session.commit()
-    print(f"Created {hours_count} hours entries")
+    print(f"Created {len(hours_rows) + len(happy_hour_rows)} hours entries")
 
 
 async def create_deals(session: AsyncSession, venues: List[Venue]) -> None:
     """Create sample deals."""
-    deals_count = 0
+    deal_rows = []
     
     for venue in venues[:3]:  # First 3 venues get deals
         for i, deal_data in enumerate(SAMPLE_DEALS):
@@ -255,19 +280,19 @@ async def create_deals(session: AsyncSession, venues: List[Venue]) -> None:
                 # Alberta gets fewer deals due to restrictions
                 break
                 
-            deal = Deal(
-                **deal_data,
-                venue_id=venue.id,
-            )
-            session.add(deal)
-            deals_count += 1
+            deal_rows.append({**deal_data, "venue_id": venue.id})
     
-    await session.commit()
-    print(f"Created {deals_count} deals")
+    await session.execute(insert(Deal), deal_rows)
+    print(f"Created {len(deal_rows)} deals")
 
 
 async def create_province_rules(session: AsyncSession) -> None:
-    """Create province-specific rules."""
+    """Create province-specific rules.
+    
+    Running API workers cache rules per process for up to
+    RULES_CACHE_TTL_SECONDS (see province_rule_repository), so they pick up
+    reseeded rules on expiry without a manual invalidation.
+    """
     rules = [
         ProvinceRule(
             province=Province.ON,
@@ -295,13 +320,16 @@ async def create_province_rules(session: AsyncSession) -> None:
         ),
     ]
     
-    for rule in rules:
-        session.add(rule)
-    
-    await session.commit()
+    session.add_all(rules)
     print(f"Created {len(rules)} province rules")
 
 
+async def _in_transaction(stage: Callable[..., Awaitable[None]], *args: Any) -> None:
+    """Run a seed stage in a new session, committing when it finishes."""
+    async with database.async_session_factory() as session, session.begin():
+        await stage(session, *args)
+
+
 async def main():
     """Main seeding function."""
     print("🌱 Starting database seeding...")
@@ -309,22 +337,24 @@ async def main():
     # Initialize database
     await init_database()
     
-    async with async_session_factory() as session:
+    # Users and venues are committed first: the later stages reference them
+    # and run on their own connections. Read the factory through the module:
+    # init_database rebinds it.
+    async with database.async_session_factory() as session, session.begin():
         # Create users
-        users = await create_users(session)
-        vendor = next(u for u in users if u.role == UserRole.VENDOR)
+        users, by_role = await create_users(session)
+        vendor = by_role[UserRole.VENDOR][0]
         
         # Create venues
         venues = await create_venues(session, vendor)
-        
-        # Create hours
-        await create_hours(session, venues)
-        
-        # Create deals
-        await create_deals(session, venues)
-        
-        # Create province rules
-        await create_province_rules(session)
+    
+    # Hours, deals and province rules write disjoint tables, so run them
+    # concurrently, each in its own transaction
+    await asyncio.gather(
+        _in_transaction(create_hours, venues),
+        _in_transaction(create_deals, venues),
+        _in_transaction(create_province_rules),
+    )
     
     print("✅ Database seeding completed!")
     print("\n📊 Sample data created:")